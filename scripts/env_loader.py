@@ -2,11 +2,14 @@
 This module loads environment variables from a .env file when imported.
 """
 
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 
+@lru_cache(maxsize=1)
 def load_env():
-    """Load environment variables from a .env file."""
+    """Load environment variables from a .env file, once per process."""
     if not load_dotenv(verbose=True):
         print("No .env file found, using environment variables.")
     else:
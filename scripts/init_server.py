@@ -3,16 +3,23 @@ Common utility functions for batch processing scripts.
 """
 
 import asyncio
-import signal
 import sys
 
+from openai_batch_sdk import (
+    close_connections,
+    configure_event_loop,
+    graceful_shutdown,
+    wait_for_shutdown,
+)
+
 
 async def test_script(add_batch_job, mock_jsonl_path):
     """
     Script to test batch processing functionality.
 
     Args:
-        add_batch_job (function): Function to add a batch job for the given file path.
+        add_batch_job (function): Coroutine function to add a batch job
+        for the given file path.
         mock_jsonl_path (str): Path to the mock JSONL file.
     """
     print("Starting batch processor...")
@@ -20,36 +27,52 @@ async def test_script(add_batch_job, mock_jsonl_path):
     print("Adding batch job...")
 
     try:
-        batch_id = add_batch_job(mock_jsonl_path)
+        batch_id = await add_batch_job(mock_jsonl_path)
         print(f"Batch job added with ID: {batch_id}")
     except Exception as ex:
         print(f"Error adding batch job: {ex}")
         sys.exit(1)
 
-    # Keep the application running for testing purposes
-    await asyncio.sleep(3600)
+    # Keep the application running until it is shut down
+    await wait_for_shutdown()
+
+
+async def run_app(main_func, signal_setup_func):
+    """
+    Sets up signal handlers on the running event loop and runs the main coroutine.
+    Once it returns or is cancelled, the outstanding tasks are cancelled within
+    a bounded time and the pooled connections to the OpenAI API are closed.
+
+    Args:
+        main_func (function): The main coroutine to run.
+        signal_setup_func (function): Function to setup signal handlers.
+    """
+    signal_setup_func(asyncio.get_running_loop())
+    try:
+        await main_func()
+    finally:
+        await graceful_shutdown()
+        await close_connections()
 
 
-def run_main(main_func, graceful_shutdown_func, signal_setup_func):
+def run_main(main_func, signal_setup_func):
     """
     Runs the main event loop with proper signal handling.
 
+    The signal handlers stop the monitoring and cancel the main coroutine on
+    SIGINT and SIGTERM, so the application shuts down gracefully. asyncio.run
+    then shuts down async generators and closes the event loop.
+
     Args:
         main_func (function): The main coroutine to run.
-        graceful_shutdown_func (function): Function to handle graceful shutdown.
         signal_setup_func (function): Function to setup signal handlers.
     """
-    loop = asyncio.get_event_loop()
-    signal_setup_func(loop)
+    configure_event_loop()
     try:
-        loop.run_until_complete(main_func())
+        asyncio.run(run_app(main_func, signal_setup_func))
     except asyncio.CancelledError:
         pass
     except KeyboardInterrupt:
         print("KeyboardInterrupt received. Shutting down...")
-        loop.run_until_complete(graceful_shutdown_func(signal.SIGINT, loop))
     finally:
-        print("Cleaning up tasks...")
-        loop.run_until_complete(loop.shutdown_asyncgens())
-        loop.close()
         print("Event loop closed.")
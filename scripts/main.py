@@ -9,19 +9,17 @@ batch jobs and provides a test function to simulate
 batch job processing.
 
 Imports:
-    asyncio: Asynchronous I/O
     signal: Signal handling
     load_dotenv: Load environment variables from a .env file
     init_monitoring, EventHandler,
     retrieve_batches_results_handler,
-    graceful_shutdown: OpenAI SDK functions
+    setup_signal_handlers, spawn_task: OpenAI SDK functions
 
 Functions:
     handle_event(event): Handles events by retrieving batch results.
     main(): Main function to run the batch processor.
 """
 
-import asyncio
 import env_loader  # pylint: disable=unused-import
 from init_server import test_script, run_main
 
@@ -29,8 +27,8 @@ from openai_batch_sdk import (
     init_monitoring,
     EventHandler,
     retrieve_batches_results_handler,
-    graceful_shutdown,
     setup_signal_handlers,
+    spawn_task,
 )
 
 
@@ -59,7 +57,7 @@ async def main():
     event_handler = EventHandler()
     event_handler.register_event(
         "batch_processing_completed",
-        lambda event: asyncio.create_task(handle_event(event)),
+        lambda event: spawn_task(handle_event(event)),
     )
     add_batch_job = init_monitoring(event_handler)
 
@@ -67,4 +65,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    run_main(main, graceful_shutdown, setup_signal_handlers)
+    run_main(main, setup_signal_handlers)
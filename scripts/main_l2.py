@@ -10,15 +10,14 @@ Public Exports:
     - retrieve_batches_results: Retrieves results for completed batch jobs.
 """
 
-import asyncio
 import env_loader  # pylint: disable=unused-import
 from init_server import test_script, run_main
 
 from openai_batch_sdk import (
-    graceful_shutdown_l2,
     init_monitoring_l2,
     retrieve_batches_results_handler_l2,
     setup_signal_handlers_l2,
+    spawn_task,
     EventHandler,
 )
 
@@ -55,7 +54,7 @@ async def main():
     event_handler = EventHandler()
     event_handler.register_event(
         "batch_processing_completed",
-        lambda event: asyncio.create_task(handle_event(event, event_handler)),
+        lambda event: spawn_task(handle_event(event, event_handler)),
     )
     add_batch_job = init_monitoring_l2(event_handler)
 
@@ -63,4 +62,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    run_main(main, graceful_shutdown_l2, setup_signal_handlers_l2)
+    run_main(main, setup_signal_handlers_l2)
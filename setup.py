@@ -18,8 +18,14 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "openai==1.30.5",
+        "httpx==0.27.0",
         "python-dotenv==1.0.1",
+        "orjson==3.10.3",
     ],
+    extras_require={
+        "http2": ["h2==4.1.0"],
+        "uvloop": ["uvloop==0.19.0; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
             "batch_processor = scripts.main:main",
@@ -36,7 +42,7 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.9",
     test_suite="tests",
     keywords="openai sdk batch api",
     project_urls={
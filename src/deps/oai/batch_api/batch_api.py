@@ -5,20 +5,89 @@ This module includes functions to:
 - Upload a batch file.
 - Submit a batch job.
 - Retrieve batch results.
+- Stream batch result lines.
+- Download batch results to disk.
 - Check batch job status.
+- List batch jobs.
+- Cancel a batch job.
+
+Each operation has an async counterpart, suffixed with _async,
+built on the async OpenAI client.
 """
 
-from openai import OpenAI
+import asyncio
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from openai.pagination import AsyncCursorPage, SyncCursorPage
+from openai.types import Batch
+
+# Connection pool settings of the shared OpenAI clients.
+# HTTP/2 is used when the optional h2 package is installed.
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP2_ENABLED = find_spec("h2") is not None
+
+# Size of the chunks read when streaming batch result files
+RESULT_CHUNK_SIZE = 64 * 1024
+
+# Size of the chunks copied when downloading batch result files to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
+@lru_cache(maxsize=1)
 def get_openai_client() -> OpenAI:
     """
-    Get an instance of the OpenAI client.
+    Get the shared instance of the OpenAI client.
+
+    The client is created once per process so its keep-alive
+    connection pool is reused across calls.
 
     Returns:
         OpenAI: An instance of the OpenAI client.
     """
-    return OpenAI()
+    return OpenAI(
+        http_client=DefaultHttpxClient(
+            limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED
+        )
+    )
+
+
+# The shared async OpenAI client, held until close_async_openai_client
+async_client_cache: Dict[str, AsyncOpenAI] = {}
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared instance of the async OpenAI client.
+
+    Returns:
+        AsyncOpenAI: An instance of the async OpenAI client.
+    """
+    client = async_client_cache.get("client")
+    if client is None:
+        client = AsyncOpenAI(
+            http_client=DefaultAsyncHttpxClient(
+                limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED
+            )
+        )
+        async_client_cache["client"] = client
+    return client
+
+
+async def close_async_openai_client() -> None:
+    """
+    Close the shared async OpenAI client and its connection pool,
+    if it was created. A later call to get_async_openai_client
+    creates a new client.
+    """
+    client = async_client_cache.pop("client", None)
+    if client is not None:
+        await client.close()
 
 
 def upload_batch_file(file_path: str) -> str:
@@ -31,7 +100,7 @@ def upload_batch_file(file_path: str) -> str:
     Returns:
         str: The ID of the uploaded file.
     """
-    client = OpenAI()
+    client = get_openai_client()
     with open(file_path, "rb") as file:
         response = client.files.create(file=file, purpose="batch")
     return response.id
@@ -48,7 +117,7 @@ def submit_batch_job(file_path: str, description: str) -> str:
     Returns:
         str: The ID of the submitted batch job.
     """
-    client = OpenAI()
+    client = get_openai_client()
     batch_input_file_id = upload_batch_file(file_path)
     response = client.batches.create(
         input_file_id=batch_input_file_id,
@@ -70,10 +139,54 @@ def retrieve_batch_result(file_id: str) -> bytes:
     Returns:
         bytes: The content of the file.
     """
-    client = OpenAI()
+    client = get_openai_client()
     return client.files.content(file_id)
 
 
+def split_complete_lines(pending: bytes, chunk: bytes) -> Tuple[List[bytes], bytes]:
+    """
+    Split the complete lines off a chunk of a streamed file.
+
+    Args:
+        pending (bytes): The incomplete last line of the previous chunks.
+        chunk (bytes): The chunk that was just read.
+
+    Returns:
+        Tuple[List[bytes], bytes]: The non-empty complete lines,
+        and the incomplete last line to prepend to the next chunk.
+    """
+    data = pending + chunk
+    end = data.rfind(b"\n")
+    if end < 0:
+        return [], data
+    lines = [line for line in data[:end].split(b"\n") if line.strip()]
+    return lines, data[end + 1 :]
+
+
+def iter_batch_result_lines(file_id: str) -> Iterator[bytes]:
+    """
+    Stream the lines of a batch result file from OpenAI,
+    without loading the whole file into memory.
+
+    The raw bytes are split on newlines without being decoded,
+    as the JSON parser reads UTF-8 bytes directly.
+
+    Args:
+        file_id (str): The ID of the file to retrieve.
+
+    Yields:
+        bytes: The non-empty lines of the file.
+    """
+    client = get_openai_client()
+    with client.files.with_streaming_response.content(file_id) as response:
+        pending = b""
+        for chunk in response.iter_bytes(RESULT_CHUNK_SIZE):
+            lines, pending = split_complete_lines(pending, chunk)
+            yield from lines
+        if pending.strip():
+            yield pending
+
+
 def check_batch_status(batch_id: str) -> dict:
     """
     Check the status of a batch job in OpenAI.
@@ -84,5 +197,182 @@ def check_batch_status(batch_id: str) -> dict:
     Returns:
         dict: The status of the batch job.
     """
-    client = OpenAI()
+    client = get_openai_client()
     return client.batches.retrieve(batch_id=batch_id)
+
+
+def list_batches(
+    limit: int = 100, after: Optional[str] = None
+) -> SyncCursorPage[Batch]:
+    """
+    List a page of batch jobs in OpenAI, most recently created first.
+
+    Args:
+        limit (int): The maximum number of batch jobs to return (1 to 100).
+        after (Optional[str]): The ID of the batch job to list after.
+
+    Returns:
+        SyncCursorPage[Batch]: A page of batch jobs.
+    """
+    client = get_openai_client()
+    if after is None:
+        return client.batches.list(limit=limit)
+    return client.batches.list(limit=limit, after=after)
+
+
+def cancel_batch_job(batch_id: str) -> Batch:
+    """
+    Cancel a batch job in OpenAI.
+
+    Args:
+        batch_id (str): The ID of the batch job to cancel.
+
+    Returns:
+        Batch: The batch job, usually in the cancelling status.
+    """
+    client = get_openai_client()
+    return client.batches.cancel(batch_id=batch_id)
+
+
+def read_batch_file(file_path: str) -> bytes:
+    """
+    Read the content of a batch file.
+
+    Args:
+        file_path (str): The path to the file to read.
+
+    Returns:
+        bytes: The content of the file.
+    """
+    with open(file_path, "rb") as file:
+        return file.read()
+
+
+async def upload_batch_file_async(file_path: str) -> str:
+    """
+    Upload a batch file to OpenAI with the async client.
+
+    The file is read in the default executor so the disk I/O
+    does not block the event loop. It is submitted with run_in_executor
+    rather than asyncio.to_thread, skipping the context copy, as the read
+    does not use context variables.
+
+    Args:
+        file_path (str): The path to the file to be uploaded.
+
+    Returns:
+        str: The ID of the uploaded file.
+    """
+    client = get_async_openai_client()
+    content = await asyncio.get_running_loop().run_in_executor(
+        None, read_batch_file, file_path
+    )
+    response = await client.files.create(
+        file=(os.path.basename(file_path), content), purpose="batch"
+    )
+    return response.id
+
+
+async def submit_batch_job_async(file_path: str, description: str) -> str:
+    """
+    Submit a batch job to OpenAI with the async client.
+
+    Args:
+        file_path (str): The path to the input file for the batch job.
+        description (str): A description for the batch job.
+
+    Returns:
+        str: The ID of the submitted batch job.
+    """
+    client = get_async_openai_client()
+    batch_input_file_id = await upload_batch_file_async(file_path)
+    response = await client.batches.create(
+        input_file_id=batch_input_file_id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={"description": description},
+    )
+    return response.id
+
+
+async def iter_batch_result_lines_async(file_id: str) -> AsyncIterator[bytes]:
+    """
+    Stream the lines of a batch result file from OpenAI with the async client.
+
+    Args:
+        file_id (str): The ID of the file to retrieve.
+
+    Yields:
+        bytes: The non-empty lines of the file.
+    """
+    client = get_async_openai_client()
+    async with client.files.with_streaming_response.content(file_id) as response:
+        pending = b""
+        async for chunk in response.iter_bytes(RESULT_CHUNK_SIZE):
+            lines, pending = split_complete_lines(pending, chunk)
+            for line in lines:
+                yield line
+        if pending.strip():
+            yield pending
+
+
+async def download_batch_result_async(file_id: str, file_path: str) -> None:
+    """
+    Stream a batch result file from OpenAI to disk with the async client,
+    without buffering the whole file in memory.
+
+    Args:
+        file_id (str): The ID of the file to retrieve.
+        file_path (str): The path of the file to write.
+    """
+    client = get_async_openai_client()
+    async with client.files.with_streaming_response.content(file_id) as response:
+        await response.stream_to_file(file_path, chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+
+async def check_batch_status_async(batch_id: str) -> Batch:
+    """
+    Check the status of a batch job in OpenAI with the async client.
+
+    Args:
+        batch_id (str): The ID of the batch job to check.
+
+    Returns:
+        Batch: The batch job.
+    """
+    client = get_async_openai_client()
+    return await client.batches.retrieve(batch_id=batch_id)
+
+
+async def list_batches_async(
+    limit: int = 100, after: Optional[str] = None
+) -> AsyncCursorPage[Batch]:
+    """
+    List a page of batch jobs in OpenAI with the async client,
+    most recently created first.
+
+    Args:
+        limit (int): The maximum number of batch jobs to return (1 to 100).
+        after (Optional[str]): The ID of the batch job to list after.
+
+    Returns:
+        AsyncCursorPage[Batch]: A page of batch jobs.
+    """
+    client = get_async_openai_client()
+    if after is None:
+        return await client.batches.list(limit=limit)
+    return await client.batches.list(limit=limit, after=after)
+
+
+async def cancel_batch_job_async(batch_id: str) -> Batch:
+    """
+    Cancel a batch job in OpenAI with the async client.
+
+    Args:
+        batch_id (str): The ID of the batch job to cancel.
+
+    Returns:
+        Batch: The batch job, usually in the cancelling status.
+    """
+    client = get_async_openai_client()
+    return await client.batches.cancel(batch_id=batch_id)
@@ -10,22 +10,31 @@ It also includes the event handler for managing events related to batch processi
 
 Public Exports:
   - init_monitoring: Initializes batch job monitoring.
-  - graceful_shutdown: Signals the monitoring to stop gracefully.
+  - graceful_shutdown: Cancels the outstanding tasks once the application returns.
   - retrieve_batches_results_handler: Handles the retrieval of batch job results.
   - retrieve_batches_results: Retrieves results for completed batch jobs.
+  - cancel_batch: Cancels a monitored batch job.
+  - spawn_task: Schedules a background task, keeping a reference to it.
+  - wait_for_shutdown: Waits until the monitoring is signaled to stop.
+  - configure_event_loop: Uses uvloop for the event loop when installed.
+  - close_connections: Closes the pooled connections to the OpenAI API.
   - EventHandler: Manages events for batch job processing.
 
 Setup:
-- The module configures logging using the setup_logging function.
+- Logging is configured by init_monitoring, when monitoring starts.
 """
 
-from utils.logging import setup_logging
 from .core import (
+    cancel_batch,
+    close_connections,
+    configure_event_loop,
     init_monitoring,
     graceful_shutdown,
     retrieve_batches_results_handler,
     retrieve_batches_results,
     setup_signal_handlers,
+    spawn_task,
+    wait_for_shutdown,
 )
 from .advanced import (
     init_monitoring_l2,
@@ -43,11 +52,14 @@ __all__ = [
     "retrieve_batches_results_handler",
     "retrieve_batches_results",
     "setup_signal_handlers",
+    "cancel_batch",
+    "spawn_task",
+    "wait_for_shutdown",
+    "configure_event_loop",
+    "close_connections",
     "init_monitoring_l2",
     "graceful_shutdown_l2",
     "retrieve_batches_results_handler_l2",
     "retrieve_batches_results_v2",
     "setup_signal_handlers_l2",
 ]
-
-setup_logging()
@@ -16,25 +16,43 @@ Public Exports:
 """
 
 import asyncio
+import os
+from functools import lru_cache
 
-from deps.oai.batch_api.batch_api import retrieve_batch_result
-from utils.env import load_environment
 from utils.logging import logger
 from .event_handler import EventHandler
 
-from .core import graceful_shutdown, init_monitoring, setup_signal_handlers
+from .core import (
+    graceful_shutdown,
+    init_monitoring,
+    persist_batches_results,
+    retrieve_batches_results,
+    setup_signal_handlers,
+    spawn_task,
+)
 
-# ==============================================================================
-# Environment Setup
-# ==============================================================================
-env = load_environment()
 # ==============================================================================
 # Logging Functions
 # ==============================================================================
 
-LOG_PFX = __file__
+LOG_PFX = "[📲🤖🧩]"
 p_logger = logger.getChild(LOG_PFX)
 
+# Bounds the number of result files downloaded at the same time
+MAX_CONCURRENT_DOWNLOADS = 4
+
+
+@lru_cache(maxsize=1)
+def get_download_slots():
+    """
+    Returns the download slots shared by the completed batch jobs,
+    created on first use from within the running event loop.
+
+    Returns:
+        asyncio.Semaphore: Bounds the number of concurrent downloads.
+    """
+    return asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
 
 # ==============================================================================
 # Batch Job Retrieval
@@ -47,17 +65,33 @@ async def retrieve_batches_results_v2(result_file_id):
         result_file_id (str): The ID of the result file.
 
     Returns:
-        bytes: The content of the result file.
+        AsyncIterator[dict]: The records of the result file,
+        parsed as they are streamed.
     """
-    result_file = retrieve_batch_result(result_file_id)
-    content = result_file.read()
-    p_logger.debug("content", content)
-    lines = content.decode().splitlines()
-    p_logger.debug("lines", lines)
-    return lines
+    return await retrieve_batches_results(result_file_id)
 
 
-async def retrieve_batches_results_handler_l2(batch_completed_event, event_handler):
+def get_batch_counts(response):
+    """
+    Extracts the request counts and errors of a batch job.
+
+    Args:
+        response (Batch): The batch job as returned by the OpenAI API.
+
+    Returns:
+        tuple: The completed count, failed count and formatted errors.
+    """
+    request_counts = response.request_counts
+    completed = request_counts.completed if request_counts else 0
+    failed = request_counts.failed if request_counts else 0
+    error_data = response.errors.data if response.errors else None
+    errors = [f"{error.code}: {error.message}" for error in error_data or []]
+    return completed, failed, errors
+
+
+async def retrieve_batches_results_handler_l2(
+    batch_completed_event, event_handler, persist_dir=None
+):
     """
     Handles retrieval of batch results for completed batch jobs
     and triggers appropriate events.
@@ -65,34 +99,41 @@ async def retrieve_batches_results_handler_l2(batch_completed_event, event_handl
     Args:
         batch_completed_event (dict): Event containing batch completion information.
         event_handler (EventHandler): The event handler instance for triggering events.
+        persist_dir (str): The directory to stream the result files to,
+        as <batch_id>.jsonl, or None to stream the parsed records instead.
+        At most MAX_CONCURRENT_DOWNLOADS result files are downloaded at once.
     """
     batch_id = batch_completed_event["batch_id"]
-    if batch_completed_event["status"] == "response_ready":
-        response = batch_completed_event["response"]
-        completed = response["completed"]
-        failed = response["failed"]
-        errors = [f"{error.code}: {error.message}" for error in response["errors"]]
-        result_file_id = response["result_file_id"]
+    response = batch_completed_event["response"]
+    if response.status == "completed" and response.output_file_id:
+        completed, failed, errors = get_batch_counts(response)
         p_logger.info("Starting Retrieve Result Process.")
-        lines = retrieve_batches_results_v2(result_file_id)
-        p_logger.debug("lines", lines)
         batch_completed_event_l2 = {
             "batch_id": batch_id,
             "status": "completed",
-            "response": lines,
             "completed": completed,
             "failed": failed,
             "errors": errors,
         }
+        if persist_dir is None:
+            batch_completed_event_l2["response"] = await retrieve_batches_results_v2(
+                response.output_file_id
+            )
+        else:
+            async with get_download_slots():
+                batch_completed_event_l2["result_path"] = await persist_batches_results(
+                    response.output_file_id,
+                    os.path.join(persist_dir, f"{batch_id}.jsonl"),
+                )
         event_handler.trigger_event("batch_completed", batch_completed_event_l2)
     else:
-        response = batch_completed_event["response"]
-        completed = response["completed"]
-        failed = response["failed"]
-        errors = [f"{error.code}: {error.message}" for error in response["errors"]]
+        completed, failed, errors = get_batch_counts(response)
         p_logger.error(
-            f"Batch {batch_id} processing status: "
-            f"completed: {completed}, failed: {failed}, errors: {errors}."
+            "Batch %s processing status: completed: %s, failed: %s, errors: %s.",
+            batch_id,
+            completed,
+            failed,
+            errors,
         )
         batch_completed_event_l2 = {
             "batch_id": batch_id,
@@ -101,41 +142,45 @@ async def retrieve_batches_results_handler_l2(batch_completed_event, event_handl
             "failed": failed,
             "errors": errors,
         }
-        event_handler.trigger_event("batch_completed", batch_completed_event)
+        event_handler.trigger_event("batch_completed", batch_completed_event_l2)
 
 
-def init_monitoring_l2(app_event_handler):
+def init_monitoring_l2(app_event_handler, persist_dir=None):
     """
     Initializes batch job monitoring with advanced features.
 
     Args:
         app_event_handler (EventHandler): The application-level event handler instance.
+        persist_dir (str): The directory to stream the result files to,
+        or None to stream the parsed records in the batch_completed events.
 
     Returns:
-        function: A function to add batch jobs given a file path.
+        function: A coroutine function to add batch jobs given a file path.
     """
     core_event_handler = EventHandler()
     core_event_handler.register_event(
         "batch_processing_completed",
-        lambda event: asyncio.create_task(
-            retrieve_batches_results_handler_l2(event, app_event_handler)
+        lambda event: spawn_task(
+            retrieve_batches_results_handler_l2(event, app_event_handler, persist_dir)
         ),
     )
     return init_monitoring(core_event_handler)
 
 
-def graceful_shutdown_l2(exit_signal, app_loop):
+async def graceful_shutdown_l2():
     """
-    Signals the monitoring to stop gracefully.
+    Shuts the application down gracefully once its main coroutine returned.
     """
-    graceful_shutdown(exit_signal, app_loop)
+    await graceful_shutdown()
 
 
-def setup_signal_handlers_l2(app_loop):
+def setup_signal_handlers_l2(app_loop, main_task=None):
     """
     Sets up signal handlers for SIGINT and SIGTERM.
 
     Args:
         app_loop: The event loop.
+        main_task: The task to cancel on an exit signal. Defaults to the task
+            calling this function.
     """
-    setup_signal_handlers(app_loop)
+    setup_signal_handlers(app_loop, main_task)
@@ -0,0 +1,111 @@
+"""
+Module: batch_state
+
+Description:
+This module persists the monitored batch jobs to a JSON file,
+so monitoring resumes after a restart instead of losing track of
+batch jobs still running on OpenAI. The batch ID is the only state
+needed to reattach to a batch job; the last observed status is kept
+for reference.
+
+Functions:
+  - batch_state_snapshot: Builds the persisted form of the monitored batch jobs.
+  - load_batch_state: Loads the persisted batch jobs.
+  - save_batch_state: Persists the batch jobs.
+  - persist_batch_state: Persists the monitored batch jobs off the event loop.
+"""
+
+import asyncio
+import os
+import orjson
+from utils.logging import logger
+
+LOG_PFX = "[📲🤖💾]"
+p_logger = logger.getChild(LOG_PFX)
+
+
+def batch_state_snapshot(monitored_batch_ids):
+    """
+    Builds the persisted form of the monitored batch jobs.
+
+    Args:
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch IDs.
+
+    Returns:
+        dict: The batch jobs keyed by batch ID, with their last observed status.
+    """
+    return {
+        batch_id: {"batch_id": batch_id, "status": poll_state.get("status")}
+        for batch_id, poll_state in monitored_batch_ids.items()
+    }
+
+
+def load_batch_state(state_path):
+    """
+    Loads the persisted batch jobs.
+
+    Args:
+        state_path (str): The path of the state file.
+
+    Returns:
+        dict: The batch jobs keyed by batch ID, empty if there is no valid state.
+    """
+    try:
+        with open(state_path, "rb") as file:
+            state = orjson.loads(file.read())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError as ex:
+        p_logger.error("Ignoring invalid batch state file %s: %s", state_path, ex)
+        return {}
+    if not isinstance(state, dict):
+        p_logger.error(
+            "Ignoring invalid batch state file %s: not a JSON object", state_path
+        )
+        return {}
+    return state
+
+
+def save_batch_state(state_path, snapshot):
+    """
+    Persists the batch jobs, replacing the state file atomically.
+
+    Args:
+        state_path (str): The path of the state file.
+        snapshot (dict): The batch jobs, as built by batch_state_snapshot.
+    """
+    state_dir = os.path.dirname(state_path)
+    if state_dir:
+        os.makedirs(state_dir, exist_ok=True)
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(orjson.dumps(snapshot))
+    os.replace(tmp_path, state_path)
+
+
+async def persist_batch_state(state_path, monitored_batch_ids):
+    """
+    Persists the monitored batch jobs. The state file is written
+    in the default executor so the disk I/O does not block the event loop.
+
+    Args:
+        state_path (str): The path of the state file, or None to skip persistence.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+
+    Returns:
+        bool: True if the batch jobs were persisted or persistence is disabled,
+        False if saving failed and should be retried.
+    """
+    if state_path is None:
+        return True
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            save_batch_state,
+            state_path,
+            batch_state_snapshot(monitored_batch_ids),
+        )
+    except OSError as ex:
+        p_logger.error("Error saving batch state: %s", ex)
+        return False
+    return True
@@ -9,21 +9,97 @@ Public Exports:
   - submit_batch_jobs: Submits batch jobs for processing.
   - add_batch_job: Adds a batch job for the given file path.
   - retrieve_batches_results: Retrieves results for completed batch jobs.
+  - persist_batches_results: Streams the result file of a batch job to disk.
+  - cancel_batch: Cancels a monitored batch job.
+  - spawn_task: Schedules a background task, keeping a reference to it.
+  - wait_for_shutdown: Waits until the monitoring is signaled to stop.
+  - configure_event_loop: Uses uvloop for the event loop when installed.
+  - close_connections: Closes the pooled connections to the OpenAI API.
 """
 
 import asyncio
+import heapq
+import os
+import random
 import signal
-from openai import APIConnectionError, RateLimitError, APIStatusError
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from typing import Literal
+import orjson
+from openai import APIConnectionError, APIStatusError, NotFoundError, RateLimitError
 from deps.oai.batch_api.batch_api import (
-    check_batch_status,
-    retrieve_batch_result,
-    submit_batch_job,
+    cancel_batch_job_async,
+    check_batch_status_async,
+    close_async_openai_client,
+    download_batch_result_async,
+    iter_batch_result_lines_async,
+    list_batches_async,
+    submit_batch_job_async,
 )
 from utils.env import load_environment
-from utils.logging import logger
+from utils.logging import logger, setup_logging
+from .batch_state import load_batch_state, persist_batch_state
+
+
+@lru_cache(maxsize=1)
+def get_aborted_flag():
+    """
+    Returns the global aborted flag, created on first use from within
+    the running event loop: on Python 3.9, asyncio primitives bind
+    to the event loop current when they are created.
+
+    Returns:
+        asyncio.Event: Event to signal when monitoring should stop.
+    """
+    return asyncio.Event()
+
+
+# Maximum number of seconds to wait for cancelled tasks on shutdown
+SHUTDOWN_TIMEOUT = 30
+
+# Global references to the running background tasks
+background_tasks = set()
+
+# Global monitored batch jobs, keyed by batch ID, owned by the monitor task
+monitored_batches = {}
+
+# Thread pools installed as default executors, keyed by event loop
+default_executors = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class BatchCommand:
+    """
+    Dataclass representing a change to the monitored batch jobs,
+    applied by the monitor task.
+
+    Attributes:
+        op (str): The change to apply (add, remove).
+        batch_id (str): The ID of the batch job.
+        meta (dict): Details of the batch job kept with its polling state,
+        such as the submitted file path and description.
+    """
+
+    op: Literal["add", "remove"]
+    batch_id: str
+    meta: dict = field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def get_batch_commands():
+    """
+    Returns the global queue of commands for the monitor task,
+    created on first use from within the running event loop.
+
+    Returns:
+        asyncio.Queue: Queue of commands for the monitor task.
+    """
+    return asyncio.Queue()
 
-# Global aborted flag
-aborted = asyncio.Event()
 
 # ==============================================================================
 # Environment Setup
@@ -37,22 +113,170 @@ LOG_PFX = "[📲🤖🎯]"
 p_logger = logger.getChild(LOG_PFX)
 
 
+# ==============================================================================
+# Background Tasks
+# ==============================================================================
+def spawn_task(coro):
+    """
+    Schedules a coroutine as a background task, keeping a reference to it
+    until it is done so it is not garbage collected mid-flight.
+
+    Args:
+        coro: The coroutine to schedule.
+
+    Returns:
+        asyncio.Task: The scheduled task.
+    """
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+# ==============================================================================
+# Polling Schedule
+# ==============================================================================
+INITIAL_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 300
+ERROR_BACKOFF_FACTOR = 4
+MAX_CONCURRENT_POLLS = 20
+LIST_PAGE_SIZE = 100
+MAX_LIST_PAGES = 10
+
+# Batch job statuses that end or continue the monitoring of a batch job
+STOP_PROCESSING_STATUSES = frozenset(
+    {"cancelled", "cancelling", "expired", "completed", "failed"}
+)
+RESUME_PROCESSING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
+
+
+def new_poll_state(batch_id, first_poll_delay=INITIAL_POLL_INTERVAL):
+    """
+    Creates the polling state for a newly monitored batch job.
+
+    Args:
+        batch_id (str): The ID of the batch job.
+        first_poll_delay (float): The number of seconds until the first poll.
+
+    Returns:
+        dict: The polling state, with the last observed status,
+        whether the batch job was missing from the last batches listing,
+        the details of the batch job and the event cancelling its in-flight polls.
+    """
+    return {
+        "batch_id": batch_id,
+        "next_poll_at": time.monotonic() + first_poll_delay,
+        "interval": INITIAL_POLL_INTERVAL,
+        "attempts": 0,
+        "status": None,
+        "unlisted": False,
+        "meta": {},
+        "cancel": asyncio.Event(),
+    }
+
+
+def schedule_next_poll(poll_state, factor=2):
+    """
+    Grows the polling interval exponentially and schedules the next poll
+    with randomized jitter, so concurrent batches don't poll in lockstep.
+
+    Args:
+        poll_state (dict): The polling state of the batch job.
+        factor (int): The interval growth factor.
+    """
+    poll_state["interval"] = min(poll_state["interval"] * factor, MAX_POLL_INTERVAL)
+    poll_state["attempts"] += 1
+    delay = poll_state["interval"] * random.uniform(0.5, 1.5)
+    poll_state["next_poll_at"] = time.monotonic() + delay
+
+
+def push_poll(poll_schedule, poll_state):
+    """
+    Adds the next poll of a batch job to the poll schedule.
+
+    Args:
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        poll_state (dict): The polling state of the batch job.
+    """
+    heapq.heappush(
+        poll_schedule, (poll_state["next_poll_at"], str(poll_state["batch_id"]))
+    )
+
+
+def is_current_poll(entry, monitored_batch_ids):
+    """
+    Determines if a poll schedule entry is still current, i.e. its batch job
+    is monitored and has not been rescheduled since.
+
+    Args:
+        entry (tuple): The (next_poll_at, batch_id) entry.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch IDs.
+
+    Returns:
+        bool: True if the entry is current, False if it is stale.
+    """
+    next_poll_at, batch_id = entry
+    poll_state = monitored_batch_ids.get(batch_id)
+    return poll_state is not None and poll_state["next_poll_at"] == next_poll_at
+
+
+def pop_due_batch_ids(poll_schedule, monitored_batch_ids, now):
+    """
+    Pops the monitored batch jobs whose next poll is due from the poll schedule,
+    dropping stale entries along the way.
+
+    Args:
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch IDs.
+        now (float): The current time.monotonic() value.
+
+    Returns:
+        list: The IDs of the batch jobs to poll.
+    """
+    batch_ids = []
+    while poll_schedule and poll_schedule[0][0] <= now:
+        entry = heapq.heappop(poll_schedule)
+        if is_current_poll(entry, monitored_batch_ids):
+            batch_ids.append(entry[1])
+    return batch_ids
+
+
+def seconds_until_next_poll(poll_schedule, monitored_batch_ids, now):
+    """
+    Computes how long the monitor can sleep before the next poll is due.
+
+    Args:
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch IDs.
+        now (float): The current time.monotonic() value.
+
+    Returns:
+        float: The number of seconds to sleep, or None when no batch job
+        is monitored.
+    """
+    while poll_schedule and not is_current_poll(poll_schedule[0], monitored_batch_ids):
+        heapq.heappop(poll_schedule)
+    if not poll_schedule:
+        return None
+    return max(poll_schedule[0][0] - now, 0)
+
+
 # ==============================================================================
 # Batch Job Submission
 # ==============================================================================
-def gen_submit_batch_job(monitored_batch_ids, description="batch prompts job"):
+def gen_submit_batch_job(commands, description="batch prompts job"):
     """
     Generates a function to submit batch jobs.
 
     Args:
-        monitored_batch_ids (dict): Dictionary to keep track of monitored batch IDs.
+        commands (asyncio.Queue): Queue of commands for the monitor task.
         description (str): Description for the batch prompts job.
 
     Returns:
-        function: A function to add batch jobs given a file path.
+        function: A coroutine function to add batch jobs given a file path.
     """
 
-    def add_batch_job(file_path):
+    async def add_batch_job(file_path):
         """
         Adds a batch job for the given file path.
 
@@ -62,11 +286,15 @@ def gen_submit_batch_job(monitored_batch_ids, description="batch prompts job"):
         Returns:
             str: The ID of the submitted batch job.
         """
-        p_logger.debug(f"Submitting batch job for file: {file_path}")
-        batch_id = submit_batch_job(file_path, description)
-        monitored_batch_ids[str(batch_id)] = {
-            "batch_id": batch_id,
-        }
+        p_logger.debug("Submitting batch job for file: %s", file_path)
+        batch_id = await submit_batch_job_async(file_path, description)
+        commands.put_nowait(
+            BatchCommand(
+                "add",
+                str(batch_id),
+                {"file_path": file_path, "description": description},
+            )
+        )
         return batch_id
 
     return add_batch_job
@@ -83,9 +311,31 @@ async def retrieve_batches_results(result_file_id):
         result_file_id (str): The ID of the result file.
 
     Returns:
-        bytes: The content of the result file.
+        AsyncIterator[dict]: The records of the result file,
+        parsed as they are streamed.
+    """
+    return (
+        orjson.loads(line)
+        async for line in iter_batch_result_lines_async(result_file_id)
+    )
+
+
+async def persist_batches_results(result_file_id, result_path):
+    """
+    Streams the result file of a completed batch job to disk.
+
+    Args:
+        result_file_id (str): The ID of the result file.
+        result_path (str): The path of the file to write.
+
+    Returns:
+        str: The path of the written file.
     """
-    return retrieve_batch_result(result_file_id)
+    result_dir = os.path.dirname(result_path)
+    if result_dir:
+        os.makedirs(result_dir, exist_ok=True)
+    await download_batch_result_async(result_file_id, result_path)
+    return result_path
 
 
 async def retrieve_batches_results_handler(batch_completed_event):
@@ -99,10 +349,59 @@ async def retrieve_batches_results_handler(batch_completed_event):
         dict: The response containing batch results.
     """
     batch_id = batch_completed_event["batch_id"]
-    p_logger.debug(f"Starting Retrieve Result Process of batch: {batch_id}.")
+    p_logger.debug("Starting Retrieve Result Process of batch: %s.", batch_id)
     return batch_completed_event["response"]
 
 
+# ==============================================================================
+# Batch Job Cancellation
+# ==============================================================================
+async def until_cancelled(awaitable, cancel_event):
+    """
+    Awaits an OpenAI call, abandoning it as soon as the cancel event is set.
+
+    Args:
+        awaitable: The OpenAI call to await.
+        cancel_event (asyncio.Event): Event to signal the call should be abandoned.
+
+    Returns:
+        The result of the call, or None if it was cancelled.
+    """
+    request = asyncio.ensure_future(awaitable)
+    cancelled = asyncio.ensure_future(cancel_event.wait())
+    try:
+        done, _ = await asyncio.wait(
+            {request, cancelled}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        cancelled.cancel()
+    if request in done:
+        return request.result()
+    request.cancel()
+    return None
+
+
+async def cancel_batch(batch_id):
+    """
+    Cancels a monitored batch job on OpenAI, then abandons its in-flight poll
+    and stops monitoring it. If the cancellation fails, the batch job
+    keeps being monitored and the error is raised.
+
+    Args:
+        batch_id (str): The ID of the batch job to cancel.
+
+    Returns:
+        Batch: The cancelled batch job.
+    """
+    p_logger.info("Cancelling batch %s.", batch_id)
+    response = await cancel_batch_job_async(batch_id)
+    poll_state = monitored_batches.get(str(batch_id))
+    if poll_state is not None:
+        poll_state["cancel"].set()
+    get_batch_commands().put_nowait(BatchCommand("remove", str(batch_id)))
+    return response
+
+
 # ==============================================================================
 # Batch Job Status Check
 # ==============================================================================
@@ -116,14 +415,7 @@ def stop_processing_status(status):
     Returns:
         bool: True if processing should stop, False otherwise.
     """
-    stop_processing_statuses = {
-        "cancelled",
-        "cancelling",
-        "expired",
-        "completed",
-        "failed",
-    }
-    return status in stop_processing_statuses
+    return status in STOP_PROCESSING_STATUSES
 
 
 def resume_processing_status(status):
@@ -136,25 +428,28 @@ def resume_processing_status(status):
     Returns:
         bool: True if processing should resume, False otherwise.
     """
-    resume_processing_statuses = {"validating", "in_progress", "finalizing"}
-    return status in resume_processing_statuses
+    return status in RESUME_PROCESSING_STATUSES
 
 
-async def check_batches_results(event_handler, monitored_batch_ids, batch_id):
+def handle_batch_status(event_handler, monitored_batch_ids, batch_id, response):
     """
-    Checks the status of batch jobs and triggers appropriate events.
+    Triggers the completion event for a finished batch job,
+    or schedules its next poll otherwise. The polling interval
+    is reset whenever the status of the batch job changes.
 
     Args:
         event_handler: The event handler instance for triggering events.
         monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
-        batch_id (str): The ID of the batch job to check.
+        batch_id (str): The ID of the batch job.
+        response (Batch): The batch job as returned by the OpenAI API.
     """
-    p_logger.info(f"Starting Check Batch Result Process for {batch_id}.")
-    response = check_batch_status(batch_id=batch_id)
     p_logger.debug(response)
-    if resume_processing_status(response.status):
-        p_logger.debug(f"Batch {batch_id} is validating.")
-    elif stop_processing_status(response.status):
+    poll_state = monitored_batch_ids.get(str(batch_id))
+    if poll_state is None or poll_state["cancel"].is_set():
+        return
+    previous_status = poll_state["status"]
+    poll_state["status"] = response.status
+    if stop_processing_status(response.status):
         del monitored_batch_ids[str(batch_id)]
         event_handler.trigger_event(
             "batch_processing_completed",
@@ -164,110 +459,518 @@ async def check_batches_results(event_handler, monitored_batch_ids, batch_id):
                 "response": response,
             },
         )
+    else:
+        if resume_processing_status(response.status):
+            p_logger.debug("Batch %s is %s.", batch_id, response.status)
+        if response.status == previous_status:
+            schedule_next_poll(poll_state)
+        else:
+            poll_state["interval"] = INITIAL_POLL_INTERVAL
+            schedule_next_poll(poll_state, factor=1)
+
+
+async def check_batches_results(event_handler, monitored_batch_ids, batch_id):
+    """
+    Checks the status of batch jobs and triggers appropriate events.
+
+    Args:
+        event_handler: The event handler instance for triggering events.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        batch_id (str): The ID of the batch job to check.
+    """
+    poll_state = monitored_batch_ids.get(str(batch_id))
+    if poll_state is None:
+        return
+    p_logger.info("Starting Check Batch Result Process for %s.", batch_id)
+    response = await until_cancelled(
+        check_batch_status_async(batch_id=batch_id), poll_state["cancel"]
+    )
+    if response is None:
+        p_logger.debug("Batch %s poll cancelled.", batch_id)
+        return
+    handle_batch_status(event_handler, monitored_batch_ids, batch_id, response)
+
+
+async def list_monitored_batches(batch_ids):
+    """
+    Fetches the given batch jobs through the paginated batches list endpoint,
+    coalescing their status checks into as few requests as possible.
+    Fewer pages than batch jobs are listed, so listing never costs
+    more requests than checking the batch jobs one by one.
+
+    Args:
+        batch_ids (list): The IDs of the batch jobs to fetch.
+
+    Returns:
+        dict: The batch jobs found, keyed by batch ID. Batch jobs older than
+        the listed pages are left out.
+    """
+    remaining = set(batch_ids)
+    found = {}
+    after = None
+    for _ in range(min(MAX_LIST_PAGES, len(batch_ids) - 1)):
+        page = await list_batches_async(limit=LIST_PAGE_SIZE, after=after)
+        for batch in page.data:
+            if batch.id in remaining:
+                found[batch.id] = batch
+                remaining.discard(batch.id)
+        if not remaining or len(page.data) < LIST_PAGE_SIZE:
+            break
+        after = page.data[-1].id
+    return found
+
+
+async def reconcile_listed_batches(
+    event_handler, monitored_batch_ids, batch_ids, aborted_flag
+):
+    """
+    Checks the results of several batch jobs with batches list requests.
+    Batch jobs missing from the last listing, usually older than the listed
+    pages, are checked individually rather than listed again.
+
+    Args:
+        event_handler: The event handler instance for triggering events.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        batch_ids (list): The IDs of the batch jobs to check.
+        aborted_flag (asyncio.Event): Event to signal when monitoring should stop.
+
+    Returns:
+        list: The IDs of the batch jobs that could not be reconciled
+        and need to be checked individually.
+    """
+    unlisted = [
+        batch_id for batch_id in batch_ids if monitored_batch_ids[batch_id]["unlisted"]
+    ]
+    listable = [
+        batch_id
+        for batch_id in batch_ids
+        if not monitored_batch_ids[batch_id]["unlisted"]
+    ]
+    if len(listable) < 2:
+        return batch_ids
+    p_logger.info("Listing batches to check %d batch results.", len(listable))
+    try:
+        listed = await until_cancelled(list_monitored_batches(listable), aborted_flag)
+    except Exception as ex:  # pylint: disable=broad-except
+        p_logger.error("Error listing batches: %s", ex)
+        return batch_ids
+    if listed is None:
+        return []
+    for batch_id, response in listed.items():
+        handle_batch_status(event_handler, monitored_batch_ids, batch_id, response)
+    missing = [batch_id for batch_id in listable if batch_id not in listed]
+    for batch_id in missing:
+        monitored_batch_ids[batch_id]["unlisted"] = True
+    return unlisted + missing
 
 
 # ==============================================================================
 # Batch Job Monitoring
 # ==============================================================================
-async def monitor_batches(event_handler, monitored_batch_ids, aborted_flag):
+def backoff_poll(monitored_batch_ids, batch_id):
+    """
+    Backs off the polling of a batch job after a failed status check.
+
+    Args:
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        batch_id (str): The ID of the batch job that failed to be checked.
+    """
+    poll_state = monitored_batch_ids.get(str(batch_id))
+    if poll_state is not None:
+        schedule_next_poll(poll_state, ERROR_BACKOFF_FACTOR)
+
+
+async def poll_batch(event_handler, monitored_batch_ids, batch_id, semaphore):
     """
-    Monitors batch jobs and checks their results periodically.
+    Checks the results of a single batch job, backing off on failure.
+    Batch jobs unknown to OpenAI, e.g. deleted or owned by another
+    organization, are no longer monitored.
 
     Args:
         event_handler: The event handler instance for triggering events.
         monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        batch_id (str): The ID of the batch job to check.
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight status checks.
+    """
+    async with semaphore:
+        try:
+            await check_batches_results(event_handler, monitored_batch_ids, batch_id)
+        except asyncio.TimeoutError as timeout_ex:
+            p_logger.error("Timeout error checking batch results: %s", timeout_ex)
+            backoff_poll(monitored_batch_ids, batch_id)
+        except APIConnectionError as api_conn_ex:
+            p_logger.error(
+                "API connection error checking batch results: %s", api_conn_ex
+            )
+            backoff_poll(monitored_batch_ids, batch_id)
+        except RateLimitError as rate_limit_ex:
+            p_logger.error("Rate limit error checking batch results: %s", rate_limit_ex)
+            backoff_poll(monitored_batch_ids, batch_id)
+        except NotFoundError as not_found_ex:
+            p_logger.error(
+                "Batch %s not found, no longer monitoring it: %s",
+                batch_id,
+                not_found_ex,
+            )
+            monitored_batch_ids.pop(str(batch_id), None)
+        except APIStatusError as api_status_ex:
+            p_logger.error("API status error checking batch results: %s", api_status_ex)
+            backoff_poll(monitored_batch_ids, batch_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            p_logger.error("Unexpected error checking batch results: %s", ex)
+            backoff_poll(monitored_batch_ids, batch_id)
+
+
+def apply_batch_command(monitored_batch_ids, poll_schedule, command):
+    """
+    Applies a command to the monitored batch jobs.
+
+    Args:
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        command (BatchCommand): The command to apply.
+    """
+    if command.op == "add":
+        poll_state = new_poll_state(command.batch_id)
+        poll_state["meta"] = command.meta
+        monitored_batch_ids[command.batch_id] = poll_state
+        push_poll(poll_schedule, poll_state)
+    elif command.op == "remove":
+        monitored_batch_ids.pop(command.batch_id, None)
+
+
+def apply_batch_commands(monitored_batch_ids, poll_schedule, commands):
+    """
+    Applies the pending commands to the monitored batch jobs.
+
+    Args:
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        commands (asyncio.Queue): Queue of commands for the monitor task.
+
+    Returns:
+        bool: True if any command was applied, False otherwise.
+    """
+    applied = False
+    while not commands.empty():
+        apply_batch_command(monitored_batch_ids, poll_schedule, commands.get_nowait())
+        applied = True
+    return applied
+
+
+async def wait_for_batch_command(commands, aborted_flag, timeout):
+    """
+    Sleeps until the next poll is due, a command is queued
+    or monitoring is aborted, whichever comes first.
+
+    Args:
+        commands (asyncio.Queue): Queue of commands for the monitor task.
         aborted_flag (asyncio.Event): Event to signal when monitoring should stop.
+        timeout (float): The number of seconds until the next poll,
+        or None to wait indefinitely.
+
+    Returns:
+        BatchCommand: The command received, or None.
+    """
+    command_task = asyncio.ensure_future(commands.get())
+    aborted_task = asyncio.ensure_future(aborted_flag.wait())
+    done, pending = await asyncio.wait(
+        {command_task, aborted_task},
+        timeout=timeout,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    for task in pending:
+        task.cancel()
+    if command_task in done:
+        return command_task.result()
+    return None
+
+
+def batch_statuses_changed(monitored_batch_ids, polled_statuses):
+    """
+    Determines if polling changed the monitored batch jobs,
+    looking only at the batch jobs that were polled.
+
+    Args:
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        polled_statuses (dict): The statuses of the polled batch jobs
+        before polling, keyed by batch ID.
+
+    Returns:
+        bool: True if a polled batch job changed status or stopped
+        being monitored, False otherwise.
+    """
+    for batch_id, status in polled_statuses.items():
+        poll_state = monitored_batch_ids.get(batch_id)
+        if poll_state is None or poll_state["status"] != status:
+            return True
+    return False
+
+
+def restore_batch_state(state_path, monitored_batch_ids):
+    """
+    Resumes monitoring the persisted batch jobs, polling them right away
+    to reconcile their status.
+
+    Args:
+        state_path (str): The path of the state file.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
     """
+    for batch_id in load_batch_state(state_path):
+        p_logger.info("Resuming monitoring of batch %s.", batch_id)
+        monitored_batch_ids[batch_id] = new_poll_state(batch_id, first_poll_delay=0)
+
+
+async def poll_due_batches(
+    event_handler, monitored_batch_ids, poll_schedule, aborted_flag, semaphore
+):
+    """
+    Checks the results of the batch jobs whose poll is due and schedules
+    the next poll of those still monitored. Several due batch jobs are checked
+    with a single batches list request; any not found there are checked
+    concurrently one by one.
+
+    Args:
+        event_handler: The event handler instance for triggering events.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        poll_schedule (list): Min-heap of (next_poll_at, batch_id) entries.
+        aborted_flag (asyncio.Event): Event to signal when monitoring should stop.
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight status checks.
+
+    Returns:
+        dict: The statuses of the polled batch jobs before polling,
+        keyed by batch ID.
+    """
+    p_logger.debug("Checking batch results...")
+    due_ids = pop_due_batch_ids(poll_schedule, monitored_batch_ids, time.monotonic())
+    polled_statuses = {
+        batch_id: monitored_batch_ids[batch_id]["status"] for batch_id in due_ids
+    }
+    batch_ids = due_ids
+    if len(batch_ids) > 1:
+        batch_ids = await reconcile_listed_batches(
+            event_handler, monitored_batch_ids, batch_ids, aborted_flag
+        )
+    results = await asyncio.gather(
+        *(
+            poll_batch(event_handler, monitored_batch_ids, batch_id, semaphore)
+            for batch_id in batch_ids
+        ),
+        return_exceptions=True,
+    )
+    for batch_id, result in zip(batch_ids, results):
+        if isinstance(result, BaseException):
+            p_logger.error("Polling batch %s was aborted: %r", batch_id, result)
+    for batch_id in due_ids:
+        if batch_id in monitored_batch_ids:
+            push_poll(poll_schedule, monitored_batch_ids[batch_id])
+    return polled_statuses
+
+
+async def monitor_batches(
+    event_handler, monitored_batch_ids, commands, aborted_flag, state_path=None
+):
+    """
+    Monitors batch jobs and checks the results of those whose poll is due.
+    The monitor sleeps until the next poll is due, unless a batch job
+    completed or a command was queued meanwhile. Each cycle only touches
+    the due batch jobs; the state file is rewritten only when commands
+    or polls changed the monitored batch jobs.
+
+    Args:
+        event_handler: The event handler instance for triggering events.
+        monitored_batch_ids (dict): Dictionary to keep track of monitored batch job IDs.
+        commands (asyncio.Queue): Queue of commands for the monitor task.
+        aborted_flag (asyncio.Event): Event to signal when monitoring should stop.
+        state_path (str): The file persisting the monitored batch jobs,
+        or None to keep them in memory only.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+    state_changed = False
+    poll_schedule = []
+    for poll_state in monitored_batch_ids.values():
+        push_poll(poll_schedule, poll_state)
     while not aborted_flag.is_set():
-        p_logger.debug("Checking batch results...")
-        if monitored_batch_ids:
-            p_logger.debug("Checking monitored batch results...")
-            for batch_id in list(monitored_batch_ids.keys()):
-                try:
-                    await check_batches_results(
-                        event_handler, monitored_batch_ids, batch_id
-                    )
-                except asyncio.TimeoutError as timeout_ex:
-                    p_logger.error(
-                        f"Timeout error checking batch results: {timeout_ex}"
-                    )
-                except APIConnectionError as api_conn_ex:
-                    p_logger.error(
-                        f"API connection error checking batch results: {api_conn_ex}"
-                    )
-                except RateLimitError as rate_limit_ex:
-                    p_logger.error(
-                        f"Rate limit error checking batch results: {rate_limit_ex}"
-                    )
-                except APIStatusError as api_status_ex:
-                    p_logger.error(
-                        f"API status error checking batch results: {api_status_ex}"
-                    )
-                except Exception as ex:  # pylint: disable=broad-except
-                    p_logger.error(f"Unexpected error checking batch results: {ex}")
-
-        await asyncio.sleep(30)
+        if apply_batch_commands(monitored_batch_ids, poll_schedule, commands):
+            state_changed = True
+        polled_statuses = await poll_due_batches(
+            event_handler, monitored_batch_ids, poll_schedule, aborted_flag, semaphore
+        )
+        if batch_statuses_changed(monitored_batch_ids, polled_statuses):
+            state_changed = True
+        if state_changed:
+            state_changed = not await persist_batch_state(
+                state_path, monitored_batch_ids
+            )
+        if any(batch_id not in monitored_batch_ids for batch_id in polled_statuses):
+            continue
+        command = await wait_for_batch_command(
+            commands,
+            aborted_flag,
+            seconds_until_next_poll(
+                poll_schedule, monitored_batch_ids, time.monotonic()
+            ),
+        )
+        if command is not None:
+            apply_batch_command(monitored_batch_ids, poll_schedule, command)
+            state_changed = True
     p_logger.debug("Monitor shutdown.")
 
 
+def configure_event_loop():
+    """
+    Uses uvloop as the event loop policy when the optional
+    uvloop package is installed. Must be called before
+    the event loop is created.
+
+    Returns:
+        bool: True if uvloop is used, False otherwise.
+    """
+    if find_spec("uvloop") is None:
+        return False
+    import uvloop  # pylint: disable=import-outside-toplevel,import-error
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def configure_default_executor(app_loop):
+    """
+    Installs a thread pool sized for I/O-bound work as the default
+    executor of the event loop, used by run_in_executor and asyncio.to_thread.
+
+    The thread pool is installed once per event loop. A default executor
+    already set on the event loop, such as one set by the application,
+    is kept.
+
+    Args:
+        app_loop (asyncio.AbstractEventLoop): The event loop.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool installed on the event loop,
+        or None if the event loop keeps its own default executor.
+    """
+    if app_loop in default_executors:
+        return default_executors[app_loop]
+    if getattr(app_loop, "_default_executor", None) is not None:
+        p_logger.info("Keeping the default executor set on the event loop")
+        return None
+
+    executor = ThreadPoolExecutor(
+        max_workers=env["thread_pool_size"], thread_name_prefix="oai-batch"
+    )
+    app_loop.set_default_executor(executor)
+    default_executors[app_loop] = executor
+    return executor
+
+
 def init_monitoring(event_handler):
     """
-    Initializes batch job monitoring.
+    Initializes batch job monitoring and configures logging.
+    Batch jobs persisted by a previous run are monitored again.
 
     Args:
         event_handler: The event handler instance for triggering events.
 
     Returns:
-        function: A function to add batch jobs given a file path.
+        function: A coroutine function to add batch jobs given a file path.
     """
-    monitored_batch_ids = {}
-    asyncio.create_task(monitor_batches(event_handler, monitored_batch_ids, aborted))
+    setup_logging()
+    configure_default_executor(asyncio.get_running_loop())
+    state_path = env["batch_state_path"]
+    restore_batch_state(state_path, monitored_batches)
+    spawn_task(
+        monitor_batches(
+            event_handler,
+            monitored_batches,
+            get_batch_commands(),
+            get_aborted_flag(),
+            state_path,
+        )
+    )
 
-    return gen_submit_batch_job(monitored_batch_ids)
+    return gen_submit_batch_job(get_batch_commands())
 
 
 def shutdown():
     """
-    Signals the monitoring to stop gracefully.
+    Signals the monitoring to stop gracefully and abandons in-flight polls.
+    The batch jobs themselves keep running on OpenAI.
     """
-    aborted.set()
+    get_aborted_flag().set()
+    for poll_state in monitored_batches.values():
+        poll_state["cancel"].set()
 
 
-async def graceful_shutdown(exit_signal, app_loop):
+async def wait_for_shutdown():
     """
-    Handles graceful shutdown on receiving exit signals.
+    Waits until the monitoring is signaled to stop.
+    """
+    await get_aborted_flag().wait()
 
-    Args:
-        exit_signal: The signal received (SIGINT, SIGTERM).
-        app-loop: The event loop.
+
+async def close_connections():
+    """
+    Closes the pooled connections to the OpenAI API.
+    """
+    await close_async_openai_client()
+
+
+async def graceful_shutdown():
+    """
+    Shuts the application down gracefully once its main coroutine returned.
 
     Actions:
-        Sets the graceful shutdown flag,
-        sleeps for 30 seconds to allow for a graceful shutdown,
-        cancels outstanding tasks, and stops the event loop.
+        Sets the graceful shutdown flag, cancels the outstanding tasks
+        and waits up to SHUTDOWN_TIMEOUT seconds for them to finish.
     """
-    print(f"\nReceived exit signal {exit_signal.name}...")
     shutdown()
-    print("Sleeping 30 seconds to allow for graceful shutdown...")
-    await asyncio.sleep(30)  # Allow some time for graceful shutdown
     tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
     print(f"Cancelling {len(tasks)} outstanding tasks")
     for task in tasks:
         task.cancel()
 
-    await asyncio.gather(*tasks, return_exceptions=True)
-    app_loop.stop()
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+        if pending:
+            print(f"{len(pending)} tasks still running after {SHUTDOWN_TIMEOUT}s")
     print("Shutdown complete.")
 
 
-def setup_signal_handlers(app_loop):
+def on_exit_signal(exit_signal, main_task=None):
+    """
+    Signals the monitoring to stop on receiving an exit signal and cancels
+    the main task, so the application shuts down even if its main coroutine
+    does not wait for the monitoring to stop.
+
+    Args:
+        exit_signal: The signal received (SIGINT, SIGTERM).
+        main_task: The task to cancel. If None, all the tasks of the running
+            event loop are cancelled.
+    """
+    print(f"\nReceived exit signal {exit_signal.name}...")
+    shutdown()
+    tasks = [main_task] if main_task is not None else asyncio.all_tasks()
+    for task in tasks:
+        task.cancel()
+
+
+def setup_signal_handlers(app_loop, main_task=None):
     """
     Sets up signal handlers for SIGINT and SIGTERM.
 
+    On an exit signal, the monitoring is signaled to stop and the main task
+    is cancelled. Cancelling the outstanding tasks within a bounded time is
+    left to graceful_shutdown, which the application awaits once its main
+    task ended.
+
     Args:
         app_loop: The event loop.
+        main_task: The task to cancel on an exit signal. Defaults to the task
+            calling this function; if there is none, all the tasks of the
+            loop are cancelled.
     """
+    if main_task is None:
+        main_task = asyncio.current_task(app_loop)
     for sig in (signal.SIGINT, signal.SIGTERM):
-        app_loop.add_signal_handler(
-            sig, lambda sig=sig: asyncio.create_task(graceful_shutdown(sig, app_loop))
-        )
+        app_loop.add_signal_handler(sig, partial(on_exit_signal, sig, main_task))
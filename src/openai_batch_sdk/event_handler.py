@@ -15,6 +15,8 @@ Classes:
   - EventHandler: Manages the registration and triggering of events.
 """
 
+from collections import defaultdict
+
 
 class EventHandler:
     """
@@ -26,7 +28,7 @@ class EventHandler:
     components through events.
 
     Attributes:
-        events (dict): A dictionary storing event names and
+        events (defaultdict): A dictionary storing event names and
         their associated callback functions.
     """
 
@@ -34,7 +36,7 @@ class EventHandler:
         """
         Initializes a new instance of the EventHandler class.
         """
-        self.events = {}
+        self.events = defaultdict(list)
 
     def register_event(self, event_name, callback):
         """
@@ -47,8 +49,6 @@ class EventHandler:
             event_name (str): The name of the event to register.
             callback (function): The function to call when the event is triggered.
         """
-        if event_name not in self.events:
-            self.events[event_name] = []
         self.events[event_name].append(callback)
 
     def trigger_event(self, event_name, data):
@@ -63,6 +63,5 @@ class EventHandler:
             event_name (str): The name of the event to trigger.
             data: The data to pass to the callback functions.
         """
-        if event_name in self.events:
-            for callback in self.events[event_name]:
-                callback(data)
+        for callback in self.events.get(event_name, ()):
+            callback(data)
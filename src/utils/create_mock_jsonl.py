@@ -45,7 +45,7 @@ def create_mock_file():
     conversation_1 = [system_message, user_message, assistant_message]
 
     json_line = create_json_line(custom_id=1, conversation=conversation_1)
-    print(json_line)
+    print(json_line.decode())
     user_message_2 = create_message(Role.USER, "Write an ad for our summer sale.")
     conversation_1 = [system_message, user_message, assistant_message]
     conversation_2 = [system_message, user_message_2]
@@ -10,12 +10,45 @@ logging levels and API keys and returns them in a dictionary.
 Functions:
   - load_environment: Loads environment variables from
   a .env file and returns them in a dictionary.
+  - get_thread_pool_size: Reads the validated size of the default executor.
 """
 
 import os
+import warnings
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# Number of worker threads of the default executor
+DEFAULT_THREAD_POOL_SIZE = 64
 
+
+def get_thread_pool_size():
+    """
+    Reads the number of worker threads of the default executor
+    from BATCH_SDK_THREAD_POOL_SIZE.
+
+    Returns:
+        int: The number of worker threads. DEFAULT_THREAD_POOL_SIZE,
+        with a warning, if the value is not a positive integer.
+    """
+    value = os.getenv("BATCH_SDK_THREAD_POOL_SIZE")
+    if value is None:
+        return DEFAULT_THREAD_POOL_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size <= 0:
+        warnings.warn(
+            f"BATCH_SDK_THREAD_POOL_SIZE={value!r} is not a positive integer, "
+            f"using {DEFAULT_THREAD_POOL_SIZE} worker threads",
+            stacklevel=2,
+        )
+        return DEFAULT_THREAD_POOL_SIZE
+    return size
+
+
+@lru_cache(maxsize=1)
 def load_environment():
     """
     Loads environment variables from a .env file.
@@ -25,6 +58,8 @@ def load_environment():
     in the project's root directory.
     It retrieves specific environment variables related to
     logging levels and the OpenAI API key.
+    The .env file is parsed once per process, the result is
+    shared by every caller and must not be modified.
 
     Returns:
         dict: A dictionary containing the following environment variables:
@@ -34,6 +69,14 @@ def load_environment():
             The log level for third-party libraries (default is "ERROR").
             - low_log_level (str): The low log level (default is "ERROR").
             - openai_api_key (str): The API key for OpenAI.
+            - batch_state_path (str): The file persisting the monitored batch jobs
+            (default is ".openai_batch_sdk/state.json" in the working directory,
+            so each project resumes only its own batch jobs).
+            - thread_pool_size (int): The number of worker threads
+            of the default executor (default is 64, also used
+            when the value is not a positive integer).
+            - log_file (str): The file the application logs to
+            (default is "app.log").
     """
     load_dotenv()  # Load environment variables from .env file
     return {
@@ -41,4 +84,10 @@ def load_environment():
         "libs_log_level": os.getenv("LOG_3RD_PARTY", "ERROR"),
         "low_log_level": os.getenv("LOW_LOG_LEVEL", "ERROR"),
         "openai_api_key": os.getenv("OPENAI_API_KEY"),
+        "batch_state_path": os.getenv(
+            "BATCH_SDK_STATE_PATH",
+            os.path.abspath(os.path.join(".openai_batch_sdk", "state.json")),
+        ),
+        "thread_pool_size": get_thread_pool_size(),
+        "log_file": os.getenv("LOG_FILE", "app.log"),
     }
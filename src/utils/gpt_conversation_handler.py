@@ -16,16 +16,20 @@ Functions:
   - create_message: Creates a GPTMessage object.
   - create_conversation: Creates a list of dictionaries
   representing a conversation from a list of GPTMessage objects.
+  - encode_conversation: Creates the pre-encoded JSON messages
+  of a conversation from a list of GPTMessage objects.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Union
+import orjson
 
 
-class Role(Enum):
+class Role(str, Enum):
     """
     Enum representing the role of a message in a conversation.
+    Roles are strings, so they serialize to JSON as their value.
     """
 
     USER = "user"
@@ -33,18 +37,31 @@ class Role(Enum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+@dataclass(frozen=True)
 class GPTMessage:
     """
     Dataclass representing a message in a conversation.
 
+    Messages are immutable, so their dictionary and JSON forms are built
+    once and shared by every conversation that includes them.
+
     Attributes:
         role (Role): The role of the message (user, system, assistant).
         content (str): The content of the message.
+        as_dict (dict): The message as sent to the OpenAI API, not to be modified.
+        as_json (orjson.Fragment): The message encoded as JSON,
+        embedded as is by orjson.dumps.
     """
 
     role: Role
     content: str
+    as_dict: dict = field(init=False, repr=False, compare=False)
+    as_json: orjson.Fragment = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        as_dict = {"role": self.role.value, "content": self.content}
+        object.__setattr__(self, "as_dict", as_dict)
+        object.__setattr__(self, "as_json", orjson.Fragment(orjson.dumps(as_dict)))
 
 
 def create_message(role: Union[Role, str], content: str) -> GPTMessage:
@@ -75,6 +92,18 @@ def create_conversation(messages: List[GPTMessage]) -> List[dict]:
     Returns:
         List[dict]: A list of dictionaries representing the conversation.
     """
-    return [
-        {"role": message.role.value, "content": message.content} for message in messages
-    ]
+    return [message.as_dict for message in messages]
+
+
+def encode_conversation(messages: List[GPTMessage]) -> List[orjson.Fragment]:
+    """
+    Create the pre-encoded JSON messages of a conversation
+    from a list of GPTMessage objects.
+
+    Args:
+        messages (List[GPTMessage]): A list of GPTMessage objects.
+
+    Returns:
+        List[orjson.Fragment]: The JSON messages, embedded as is by orjson.dumps.
+    """
+    return [message.as_json for message in messages]
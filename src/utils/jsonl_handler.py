@@ -10,22 +10,27 @@ and write multiple JSON lines to a file.
 Functions:
   - create_json_line: Creates a JSON line from a conversation.
   - write_jsonl_file: Writes multiple JSON lines to a file.
+  - iter_jsonl: Reads the JSON lines of a file without copying it into memory.
 """
 
-import json
-from typing import List
+import mmap
+from typing import Iterator, List
+import orjson
 from src.utils.gpt_conversation_handler import (
     GPTMessage,
-    create_conversation,
+    encode_conversation,
 )
 
+# Size of the write buffer of JSONL files
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def create_json_line(
     custom_id: str,
     conversation: List[GPTMessage],
     model: str = "gpt-4",
     max_tokens: int = 1500,
-) -> str:
+) -> bytes:
     """
     Creates a JSON line from a conversation.
 
@@ -37,7 +42,7 @@ def create_json_line(
         conversation (default is 1500).
 
     Returns:
-        str: A JSON string representing the conversation.
+        bytes: A UTF-8 encoded JSON document representing the conversation.
     """
     json_line = {
         "custom_id": custom_id,
@@ -45,24 +50,54 @@ def create_json_line(
         "url": "/v1/chat/completions",
         "body": {
             "model": model,
-            "messages": create_conversation(conversation),
+            "messages": encode_conversation(conversation),
             "max_tokens": max_tokens,
         },
     }
-    return json.dumps(json_line)
+    return orjson.dumps(json_line)
 
 
-def write_jsonl_file(filename: str, conversations: List[dict]) -> None:
+def write_jsonl_file(filename: str, conversations: List[bytes]) -> None:
     """
-    Writes multiple JSON lines to a file.
+    Writes multiple JSON lines to a file through a large write buffer,
+    without joining them into one copy of the whole file first.
 
     Args:
         filename (str): The name of the file to write to.
-        conversations (List[str]): A list of JSON strings representing conversations.
+        conversations (List[bytes]): A list of JSON lines representing conversations,
+        as returned by create_json_line.
 
     Returns:
         None
     """
-    with open(filename, "w", encoding="utf-8") as file:
-        for conversation in conversations:
-            file.write(conversation + "\n")
+    with open(filename, "wb", buffering=WRITE_BUFFER_SIZE) as file:
+        file.writelines(conversation + b"\n" for conversation in conversations)
+
+
+def iter_jsonl(filename: str) -> Iterator[bytes]:
+    """
+    Reads the JSON lines of a file through a read-only memory map,
+    so the file is never copied into memory as a whole.
+
+    Args:
+        filename (str): The name of the file to read.
+
+    Yields:
+        bytes: The non-empty lines of the file, to be parsed with orjson.loads.
+    """
+    with open(filename, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return
+        with mapped:
+            pos = 0
+            size = len(mapped)
+            while pos < size:
+                end = mapped.find(b"\n", pos)
+                if end < 0:
+                    end = size
+                line = mapped[pos:end]
+                if line.strip():
+                    yield line
+                pos = end + 1
@@ -14,28 +14,32 @@ Functions:
   - get_module_logger: Returns a logger for a specific module.
   - get_ad_processing_logger: Returns a logger for ad processing
   with a specific stage emoji.
+  - clear_logger_caches: Forgets the loggers returned by the getters.
+  - stop_log_listener: Stops the log listener and the periodic flush at exit.
+  - teardown_logging: Undoes setup_logging, so it can run again.
+  - configure_log_levels: Configures the root and APP loggers
+  with the log levels of the environment, on first use.
 
 Classes:
   - FeatureFilter: A logging filter class for specific feature-based logging.
+  - ChildAttrFilter: A logging filter adding the child logger name to records.
+  - EmojiFormatter: A formatter replacing log levels with their emojis.
+  - BufferedFileHandler: A file handler that flushes periodically
+  instead of after every record.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
+from functools import lru_cache
 from utils.env import load_environment
 from utils.project import get_project_root
 
-env_vars = load_environment()
-
-# Environment variable to set the log level for your application
-app_log_level = env_vars["app_log_level"].upper()
-libs_log_level = env_vars["libs_log_level"].upper()
-low_log_level = env_vars["low_log_level"].upper()
-
-print(f"App log level: {app_log_level}")
-print(f"Libs log level: {libs_log_level}")
-print(f"Low log level: {low_log_level}")
-
 # Emoji mappings for log levels
 log_level_emojis = {
     "DEBUG": "🐞",  # Bug emoji for debug
@@ -50,118 +54,286 @@ logger_name_emojis = {
     "DB": "🗄️",  # Floppy disk for 'database' operations
 }
 
-old_factory = logging.getLogRecordFactory()
+# Logger names resolved to their (child, displayed name) pair
+record_names = {}
 
 
-def emoji_record_factory(*args, **kwargs):
+def resolve_record_name(name):
     """
-    A custom log record factory that adds emojis to log levels and logger names.
+    Resolves a logger name to the child and name displayed in log records,
+    remembering the result for the next records of the logger.
 
     Args:
-        *args: Positional arguments passed to the original log record factory.
-        **kwargs: Keyword arguments passed to the original log record factory.
+        name (str): The name of the logger.
+
+    Returns:
+        tuple: The displayed child and logger name.
+    """
+    child = "" if name == "APP" else name.removeprefix("APP.")
+    resolved = record_names[name] = (child, logger_name_emojis.get("APP", name))
+    return resolved
+
+
+class EmojiFormatter(logging.Formatter):
+    """
+    A formatter replacing log levels with their emojis in the formatted
+    message only; the record keeps its levelname for any other handler.
+    """
+
+    def format(self, record):
+        levelname = record.levelname
+        record.levelname = log_level_emojis.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class ChildAttrFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """
+    A logging filter adding the child logger name and the app emoji
+    to the records of the APP handlers. Filters run once a record passed
+    the level checks, so suppressed records skip this work.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "child"):
+            resolved = record_names.get(record.name) or resolve_record_name(record.name)
+            record.child, record.name = resolved
+        return True
+
+
+logger = logging.getLogger("APP")
+logger.propagate = False
+
+
+@lru_cache(maxsize=1)
+def configure_log_levels():
+    """
+    Loads the log levels from the environment and configures the root
+    and APP loggers with them. The environment is read on first use
+    rather than on import, and only once.
 
     Returns:
-        logging.LogRecord: A log record with modified levelname and name.
+        dict: The numeric app, libs and low log levels,
+        keyed by their environment variable name.
+    """
+    env_vars = load_environment()
+
+    # Environment variable to set the log level for your application
+    levels = {
+        name: env_vars[name].upper()
+        for name in ("app_log_level", "libs_log_level", "low_log_level")
+    }
+    sys.stdout.write(
+        f"App log level: {levels['app_log_level']}\n"
+        f"Libs log level: {levels['libs_log_level']}\n"
+        f"Low log level: {levels['low_log_level']}\n"
+    )
+
+    # Numeric log levels, resolved once rather than by every setLevel call
+    level_nos = {name: logging.getLevelName(level) for name, level in levels.items()}
+
+    # Basic configuration of logging
+    # Set the basic configuration for the root logger
+    root_handler = logging.StreamHandler(sys.stdout)
+    root_handler.setFormatter(EmojiFormatter(logging.BASIC_FORMAT))
+    logging.basicConfig(level=level_nos["libs_log_level"], handlers=[root_handler])
+
+    logger.setLevel(level_nos["app_log_level"])
+    return level_nos
+
+
+# Length of the source directory prefix stripped from library logger names
+PRJ_SRC_LEN = len(f"{get_project_root()}/src/")
+
+
+# Filter for specific features
+class FeatureFilter(logging.Filter):  # pylint: disable=too-few-public-methods
     """
-    record = old_factory(*args, **kwargs)
+    A logging filter class for specific feature-based logging.
 
-    child = record.name.removeprefix("APP.")
-    if not child == "APP":
-        record.child = f"{child}"
-    else:
-        record.child = ""
+    This filter allows logs to be enabled for specific features by matching
+    any of the feature names within the log message. The names are compiled
+    once into a single pattern, so each record costs one regex search.
+
+    Attributes:
+        feature_names (tuple): The names of the features to filter logs for.
+    """
+
+    def __init__(self, *feature_names):
+        super().__init__()
+        self.feature_names = feature_names
+        self._search = re.compile("|".join(map(re.escape, feature_names))).search
+
+    def filter(self, record):
+        return self._search(record.getMessage()) is not None
 
-    # Apply pre-defined emoji from mapping, using the existing levelname and name
-    record.levelname = log_level_emojis.get(record.levelname.strip(), record.levelname)
-    record.name = logger_name_emojis.get("APP", record.name)
 
-    return record
+# Listeners running the handlers of the APP logger, once set up,
+# with the event stopping the periodic flush and the queue handler feeding them
+log_listeners = []
+
+# Buffering of the log file
+FILE_BUFFER_SIZE = 64 * 1024
+FILE_FLUSH_INTERVAL = 1
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler writing through a large buffer, flushed periodically,
+    on records at or above flush_level and on close,
+    instead of after every record.
 
+    Attributes:
+        buffer_size (int): The size of the write buffer of the file.
+        flush_level (int): The level of the records flushed right away.
+    """
 
-def record_factory(*args, **kwargs):
+    def __init__(
+        self, filename, buffer_size=FILE_BUFFER_SIZE, flush_level=logging.ERROR
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename)
+
+    def _open(self):
+        return open(  # pylint: disable=consider-using-with
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+def start_periodic_flush(handler, interval=FILE_FLUSH_INTERVAL):
     """
-    A custom log record factory that centers the levelname.
+    Flushes a handler every interval seconds from a daemon thread.
 
     Args:
-        *args: Positional arguments passed to the original log record factory.
-        **kwargs: Keyword arguments passed to the original log record factory.
+        handler (logging.Handler): The handler to flush.
+        interval (float): The number of seconds between flushes.
 
     Returns:
-        logging.LogRecord: A log record with centered levelname.
+        threading.Event: Event to set to stop flushing.
     """
-    record = old_factory(*args, **kwargs)
-    record.levelname = record.levelname.center(7, " ")
-    return record
+    stopped = threading.Event()
 
+    def flush_periodically():
+        while not stopped.wait(interval):
+            handler.flush()
 
-logging.setLogRecordFactory(emoji_record_factory)
+    threading.Thread(target=flush_periodically, name="log-flush", daemon=True).start()
+    return stopped
 
-# Basic configuration of logging
-# Set the basic configuration for the root logger
-logging.basicConfig(level=libs_log_level, handlers=[logging.StreamHandler(sys.stdout)])
 
-logger = logging.getLogger("APP")
-logger.propagate = False
-logger.setLevel(app_log_level)
+def stop_log_listener(listener, flush_stopped):
+    """
+    Stops the listener, handing the queued records over to the handlers,
+    then the periodic flush, before logging.shutdown closes the handlers.
+
+    Args:
+        listener (logging.handlers.QueueListener): The listener to stop.
+        flush_stopped (threading.Event): Event stopping the periodic flush.
+    """
+    listener.stop()
+    flush_stopped.set()
 
 
 # Custom logger setup
-def setup_logging():
+def setup_logging(log_file=None):
     """
     Configures logging settings for the application.
 
     This function sets up console and file handlers with specified formats,
     applies logging level configurations, and optionally filters logs based on features.
+    The APP logger only enqueues records; the console and file handlers
+    run on a background listener thread, stopped at exit
+    along with the periodic flush of the file handler.
+    Calling it again once the handlers are set up does nothing.
+
+    Args:
+        log_file (str): The log file, or None for the LOG_FILE
+        of the environment.
     """
+    if log_listeners:
+        return
+    level_nos = configure_log_levels()
+    if log_file is None:
+        log_file = load_environment()["log_file"]
+
     # Create formatters and add to handlers
     log_format = "%(asctime)s[%(name)s%(levelname)s]%(child)s%(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
-    formatter = logging.Formatter(log_format, datefmt=date_format)
+    formatter = EmojiFormatter(log_format, datefmt=date_format)
+
+    child_filter = ChildAttrFilter()
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(app_log_level)
+    console_handler.setLevel(level_nos["app_log_level"])
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.addFilter(child_filter)
 
-    # File handler (for more persistent logging)
-    file_handler = logging.FileHandler("app.log")
+    # File handler (for more persistent logging), buffered and
+    # flushed periodically; logging.shutdown flushes it at exit
+    file_handler = BufferedFileHandler(log_file)
     file_handler.setLevel("INFO")
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    file_handler.addFilter(child_filter)
+    flush_stopped = start_periodic_flush(file_handler)
+
+    # Records are handed over to the handlers through a queue
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    log_listeners.append((listener, flush_stopped, queue_handler))
+    atexit.register(stop_log_listener, listener, flush_stopped)
 
     # Optionally, suppress excessive logging from third-party libraries
     logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
-    # Filter for specific features
-    class FeatureFilter(logging.Filter):  # pylint: disable=too-few-public-methods
-        """
-        A logging filter class for specific feature-based logging.
-
-        This filter allows logs to be enabled for specific features by matching
-        the feature name within the log message.
-
-        Attributes:
-            feature_name (str): The name of the feature to filter logs for.
-        """
-
-        def __init__(self, feature_name):
-            super().__init__()
-            self.feature_name = feature_name
-
-        def filter(self, record):
-            return self.feature_name in record.msg
-
     # Example: Enabling logs for ad generation feature
-    if "FEATURE" in os.getenv("LOG_FEATURES", ""):
-        feature_processing_filter = FeatureFilter("FEATURE")
+    log_features = [
+        f.strip() for f in os.getenv("LOG_FEATURES", "").split(",") if f.strip()
+    ]
+    if log_features:
+        feature_processing_filter = FeatureFilter(*log_features)
         console_handler.addFilter(feature_processing_filter)
         file_handler.addFilter(feature_processing_filter)
 
 
+def teardown_logging():
+    """
+    Undoes setup_logging: stops the listener and the periodic flush,
+    removes the queue handler from the APP logger and closes the
+    console and file handlers, so logging can be set up again.
+    """
+    while log_listeners:
+        listener, flush_stopped, queue_handler = log_listeners.pop()
+        atexit.unregister(stop_log_listener)
+        stop_log_listener(listener, flush_stopped)
+        logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            handler.close()
+
+
+@lru_cache(maxsize=None)
 def get_lib_logger(lib_name):
     """
-    Returns a logger for a specific library.
+    Returns a logger for a specific library, created once per library.
 
     Args:
         lib_name (str): The name of the library.
@@ -169,16 +341,20 @@ def get_lib_logger(lib_name):
     Returns:
         logging.Logger: A logger instance for the specified library.
     """
-    prj_root_len = len(f"{get_project_root()}/src/")
-    log_pfx = f"[{lib_name[prj_root_len:]}]"
+    low_log_level = configure_log_levels()["low_log_level"]
+    log_pfx = f"[{lib_name[PRJ_SRC_LEN:]}]"
     p_logger = logger.getChild(log_pfx)
-    p_logger.setLevel(low_log_level)
+    # setLevel clears the level caches of every logger, so skip it when
+    # the level is already in place
+    if p_logger.level != low_log_level:
+        p_logger.setLevel(low_log_level)
     return p_logger
 
 
+@lru_cache(maxsize=None)
 def get_module_logger(module_name):
     """
-    Returns a logger for a specific module.
+    Returns a logger for a specific module, once the log levels are configured.
 
     Args:
         module_name (str): The name of the module.
@@ -186,12 +362,15 @@ def get_module_logger(module_name):
     Returns:
         logging.Logger: A logger instance for the specified module.
     """
+    configure_log_levels()
     return logger.getChild(module_name)
 
 
+@lru_cache(maxsize=None)
 def get_ad_processing_logger(stage_emoji):
     """
-    Returns a logger for ad processing with a specific stage emoji.
+    Returns a logger for ad processing with a specific stage emoji,
+    created once per stage.
 
     Args:
         stage_emoji (str): The emoji representing the stage of ad processing.
@@ -199,11 +378,23 @@ def get_ad_processing_logger(stage_emoji):
     Returns:
         logging.Logger: A logger instance for app with the specified stage emoji.
     """
+    app_log_level = configure_log_levels()["app_log_level"]
     log_pfx = f"[📲🤖{stage_emoji}]"
     p_logger = logger.getChild(log_pfx)
-    p_logger.setLevel(app_log_level)
+    if p_logger.level != app_log_level:
+        p_logger.setLevel(app_log_level)
     return p_logger
 
 
+def clear_logger_caches():
+    """
+    Forgets the loggers returned by the getters, so the next calls
+    configure them again.
+    """
+    get_lib_logger.cache_clear()
+    get_module_logger.cache_clear()
+    get_ad_processing_logger.cache_clear()
+
+
 if __name__ == "__main__":
     setup_logging()
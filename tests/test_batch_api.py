@@ -1,21 +1,40 @@
 """
 file: tests/test_batch_api.py
-Unit tests for the core functionality of the openai_batch_sdk module.
+Unit tests for the OpenAI batch API wrappers of deps.oai.batch_api.
 
 This module includes tests for the following functions:
-- gen_submit_batch_job
-- retrieve_batches_results_handler
-- init_monitoring
-- graceful_shutdown
+- get_openai_client: Creates the pooled OpenAI client once.
+- upload_batch_file: Uploads a batch input file.
+- submit_batch_job: Uploads a file and creates a batch job for it.
+- retrieve_batch_result: Retrieves the content of a result file.
+- iter_batch_result_lines: Streams the lines of a result file.
+- check_batch_status: Retrieves a batch job.
+- list_batches: Lists a page of batch jobs.
+- check_batch_status_async: Retrieves a batch job with the async client.
+- upload_batch_file_async: Uploads a batch input file with the async client.
+- close_async_openai_client: Closes the shared async client.
+- download_batch_result_async: Streams a result file to disk.
 """
 
+import asyncio
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, AsyncMock, Mock, mock_open
+from openai.pagination import SyncCursorPage
+from openai.types import Batch, FileObject
 from deps.oai.batch_api.batch_api import (
+    async_client_cache,
+    get_async_openai_client,
+    get_openai_client,
     upload_batch_file,
     submit_batch_job,
     retrieve_batch_result,
+    iter_batch_result_lines,
     check_batch_status,
+    check_batch_status_async,
+    close_async_openai_client,
+    download_batch_result_async,
+    list_batches,
+    upload_batch_file_async,
 )
 
 
@@ -24,25 +43,70 @@ class TestBatchAPI(unittest.TestCase):
     Test suite for the batch API functions.
     """
 
-    @patch("deps.oai.batch_api.batch_api.OpenAI")
+    @classmethod
+    def setUpClass(cls):
+        """
+        Patch the OpenAI clients and create one event loop
+        for the whole test suite.
+        """
+        cls.loop = asyncio.new_event_loop()
+        cls.patchers = [
+            patch("deps.oai.batch_api.batch_api.OpenAI"),
+            patch("deps.oai.batch_api.batch_api.AsyncOpenAI"),
+        ]
+        cls.mock_open_ai, cls.mock_async_open_ai = [
+            patcher.start() for patcher in cls.patchers
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Restore the OpenAI clients and close the shared event loop.
+        """
+        for patcher in cls.patchers:
+            patcher.stop()
+        cls.loop.close()
+
+    def setUp(self):
+        """
+        Reset the patched OpenAI clients and drop the cached ones,
+        so each test starts from fresh mocks.
+        """
+        for mock_client_class in (self.mock_open_ai, self.mock_async_open_ai):
+            mock_client_class.reset_mock()
+            mock_client_class.return_value.reset_mock(
+                return_value=True, side_effect=True
+            )
+        get_openai_client.cache_clear()
+        async_client_cache.clear()
+
+    def test_get_openai_client(self):
+        """
+        Test the get_openai_client function to ensure the client is created once.
+
+        Asserts:
+            The OpenAI client is constructed once, with a pooled HTTP client,
+            and reused.
+        """
+        self.assertIs(get_openai_client(), get_openai_client())
+        self.mock_open_ai.assert_called_once()
+        self.assertIn("http_client", self.mock_open_ai.call_args.kwargs)
+
     @patch("builtins.open", new_callable=mock_open, read_data="data")
-    def test_upload_batch_file(self, mock_file, mock_open_ai):
+    def test_upload_batch_file(self, mock_file):
         """
         Test the upload_batch_file function to ensure it correctly uploads a file.
 
         Args:
             mock_file: Mock for the built-in open function.
-            MockOpenAI: Mock for the OpenAI client.
 
         Asserts:
             The OpenAI client files.
             create method is called once with the correct parameters.
             The function returns the expected file ID.
         """
-        mock_client = mock_open_ai.return_value
-        mock_response = MagicMock()
-        mock_response.id = "file-id"
-        mock_client.files.create.return_value = mock_response
+        mock_client = self.mock_open_ai.return_value
+        mock_client.files.create.return_value = Mock(spec=FileObject, id="file-id")
 
         file_path = "tests/mock_data.jsonl"
         result = upload_batch_file(file_path)
@@ -52,29 +116,22 @@ class TestBatchAPI(unittest.TestCase):
         )
         self.assertEqual(result, "file-id")
 
-    @patch("deps.oai.batch_api.batch_api.OpenAI")
     @patch("builtins.open", new_callable=mock_open, read_data="data")
-    def test_submit_batch_job(self, _, mock_open_ai):
+    def test_submit_batch_job(self, _):
         """
         Test the submit_batch_job function to ensure it correctly submits a batch job.
 
         Args:
             mock_file: Mock for the built-in open function.
-            MockOpenAI: Mock for the OpenAI client.
 
         Asserts:
             The function returns the expected batch ID.
             The OpenAI client batches.
             create method is called once with the correct parameters.
         """
-        mock_client = mock_open_ai.return_value
-        mock_upload_response = MagicMock()
-        mock_upload_response.id = "file-id"
-        mock_client.files.create.return_value = mock_upload_response
-
-        mock_batch_response = MagicMock()
-        mock_batch_response.id = "batch-id"
-        mock_client.batches.create.return_value = mock_batch_response
+        mock_client = self.mock_open_ai.return_value
+        mock_client.files.create.return_value = Mock(spec=FileObject, id="file-id")
+        mock_client.batches.create.return_value = Mock(spec=Batch, id="batch-id")
 
         file_path = "mock_data.jsonl"
         description = "Test description"
@@ -88,22 +145,18 @@ class TestBatchAPI(unittest.TestCase):
             metadata={"description": description},
         )
 
-    @patch("deps.oai.batch_api.batch_api.OpenAI")
-    def test_retrieve_batch_result(self, mock_open_ai):
+    def test_retrieve_batch_result(self):
         """
         Test the retrieve_batch_result function
         to ensure it correctly retrieves batch results.
 
-        Args:
-            MockOpenAI: Mock for the OpenAI client.
-
         Asserts:
             The OpenAI client files.
             content method is called once with the correct file ID.
             The function returns the expected response content.
         """
-        mock_client = mock_open_ai.return_value
-        mock_response = MagicMock()
+        mock_client = self.mock_open_ai.return_value
+        mock_response = Mock()
         mock_client.files.content.return_value = mock_response
 
         file_id = "file-id"
@@ -112,22 +165,40 @@ class TestBatchAPI(unittest.TestCase):
         mock_client.files.content.assert_called_once_with(file_id)
         self.assertEqual(result, mock_response)
 
-    @patch("deps.oai.batch_api.batch_api.OpenAI")
-    def test_check_batch_status(self, mock_open_ai):
+    def test_iter_batch_result_lines(self):
+        """
+        Test the iter_batch_result_lines function
+        to ensure it streams the lines of a batch result file.
+
+        Asserts:
+            The streaming files content method is called with the correct file ID.
+            The function yields the non-empty lines of the file,
+            including lines split across chunks and the unterminated last line.
+        """
+        mock_client = self.mock_open_ai.return_value
+        mock_stream = mock_client.files.with_streaming_response.content
+        mock_response = mock_stream.return_value.__enter__.return_value
+        mock_response.iter_bytes.return_value = iter(
+            [b'{"a": 1}\n\n{"b"', b': 2}\n{"c": 3}']
+        )
+
+        result = list(iter_batch_result_lines("file-id"))
+
+        mock_stream.assert_called_once_with("file-id")
+        self.assertEqual(result, [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}'])
+
+    def test_check_batch_status(self):
         """
         Test the check_batch_status function
         to ensure it correctly checks the batch status.
 
-        Args:
-            MockOpenAI: Mock for the OpenAI client.
-
         Asserts:
             The OpenAI client batches.
             retrieve method is called once with the correct batch ID.
             The function returns the expected batch status.
         """
-        mock_client = mock_open_ai.return_value
-        mock_response = MagicMock()
+        mock_client = self.mock_open_ai.return_value
+        mock_response = Mock(spec=Batch)
         mock_client.batches.retrieve.return_value = mock_response
 
         batch_id = "batch-id"
@@ -136,6 +207,117 @@ class TestBatchAPI(unittest.TestCase):
         mock_client.batches.retrieve.assert_called_once_with(batch_id=batch_id)
         self.assertEqual(result, mock_response)
 
+    def test_list_batches(self):
+        """
+        Test the list_batches function
+        to ensure it correctly lists a page of batch jobs.
+
+        Asserts:
+            The OpenAI client batches.
+            list method is called once with the correct pagination parameters.
+            The function returns the expected page.
+        """
+        mock_client = self.mock_open_ai.return_value
+        mock_page = Mock(spec=SyncCursorPage)
+        mock_client.batches.list.return_value = mock_page
+
+        result = list_batches(limit=10, after="batch-id")
+
+        mock_client.batches.list.assert_called_once_with(limit=10, after="batch-id")
+        self.assertEqual(result, mock_page)
+
+    def test_check_batch_status_async(self):
+        """
+        Test the check_batch_status_async function
+        to ensure it checks the batch status with the async client.
+
+        Asserts:
+            The async OpenAI client batches.
+            retrieve method is awaited once with the correct batch ID.
+            The function returns the expected batch status.
+        """
+        mock_client = self.mock_async_open_ai.return_value
+        mock_response = Mock(spec=Batch)
+        mock_client.batches.retrieve = AsyncMock(return_value=mock_response)
+
+        result = self.loop.run_until_complete(check_batch_status_async("batch-id"))
+
+        mock_client.batches.retrieve.assert_awaited_once_with(batch_id="batch-id")
+        self.assertEqual(result, mock_response)
+
+    @patch("builtins.open", new_callable=mock_open, read_data=b"data")
+    def test_upload_batch_file_async(self, mock_file):
+        """
+        Test the upload_batch_file_async function
+        to ensure it uploads the file content with the async client.
+
+        Args:
+            mock_file: Mock for the built-in open function.
+
+        Asserts:
+            The file is opened in binary read mode.
+            The async OpenAI client files.create method is awaited once
+            with the file name and content.
+            The function returns the expected file ID.
+        """
+        mock_client = self.mock_async_open_ai.return_value
+        mock_client.files.create = AsyncMock(
+            return_value=Mock(spec=FileObject, id="file-id")
+        )
+
+        result = self.loop.run_until_complete(
+            upload_batch_file_async("dir/test_file.jsonl")
+        )
+
+        mock_file.assert_called_once_with("dir/test_file.jsonl", "rb")
+        mock_client.files.create.assert_awaited_once_with(
+            file=("test_file.jsonl", b"data"), purpose="batch"
+        )
+        self.assertEqual(result, "file-id")
+
+    def test_close_async_openai_client(self):
+        """
+        Test the close_async_openai_client function
+        to ensure it closes the shared async client once.
+
+        Asserts:
+            The shared async client is closed.
+            A new client is created after closing.
+            Closing without a shared client does nothing.
+        """
+        self.mock_async_open_ai.return_value.close = AsyncMock()
+        get_async_openai_client()
+
+        self.loop.run_until_complete(close_async_openai_client())
+        self.loop.run_until_complete(close_async_openai_client())
+
+        self.mock_async_open_ai.return_value.close.assert_awaited_once()
+        get_async_openai_client()
+        self.assertEqual(self.mock_async_open_ai.call_count, 2)
+
+    def test_download_batch_result_async(self):
+        """
+        Test the download_batch_result_async function
+        to ensure it streams the result file to disk.
+
+        Asserts:
+            The streaming files content method is called with the correct file ID.
+            The response is streamed to the given path in large chunks.
+        """
+        mock_client = self.mock_async_open_ai.return_value
+        mock_stream = mock_client.files.with_streaming_response.content
+        mock_response = mock_stream.return_value.__aenter__.return_value
+        mock_response.stream_to_file = AsyncMock()
+
+        self.loop.run_until_complete(
+            download_batch_result_async("file-id", "results.jsonl")
+        )
+
+        mock_stream.assert_called_once_with("file-id")
+        mock_response.stream_to_file.assert_awaited_once_with(
+            "results.jsonl", chunk_size=1 << 20
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,75 @@
+"""
+file: tests/test_batch_state.py
+Unit tests for the persistence of the monitored batch jobs.
+
+This module includes tests for the following functions:
+- batch_state_snapshot: Builds the persisted form of the monitored batch jobs.
+- load_batch_state: Loads the persisted batch jobs.
+- save_batch_state: Persists the batch jobs.
+"""
+
+import os
+import tempfile
+import unittest
+from openai_batch_sdk.batch_state import (
+    batch_state_snapshot,
+    load_batch_state,
+    save_batch_state,
+)
+
+
+class TestBatchState(unittest.TestCase):
+    """
+    Test suite for the batch state persistence functions.
+    """
+
+    def test_save_and_load_batch_state(self):
+        """
+        Test the save_batch_state and load_batch_state functions to ensure
+        the monitored batch jobs survive a round trip through the state file.
+
+        Asserts:
+            The state file is created, including its missing directory.
+            The loaded batch jobs match the saved snapshot.
+        """
+        monitored_batch_ids = {
+            "batch-id": {"batch_id": "batch-id", "status": "in_progress"},
+        }
+        snapshot = batch_state_snapshot(monitored_batch_ids)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = os.path.join(tmp_dir, "state", "state.json")
+            save_batch_state(state_path, snapshot)
+
+            self.assertTrue(os.path.exists(state_path))
+            self.assertEqual(load_batch_state(state_path), snapshot)
+
+    def test_load_missing_batch_state(self):
+        """
+        Test the load_batch_state function to ensure a missing state file
+        means no batch jobs to resume.
+
+        Asserts:
+            An empty dictionary is returned.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = os.path.join(tmp_dir, "state.json")
+            self.assertEqual(load_batch_state(state_path), {})
+
+    def test_load_non_object_batch_state(self):
+        """
+        Test the load_batch_state function to ensure a state file holding
+        valid JSON other than an object is ignored like a corrupt one.
+
+        Asserts:
+            An empty dictionary is returned.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = os.path.join(tmp_dir, "state.json")
+            with open(state_path, "wb") as file:
+                file.write(b'["batch_1"]')
+            self.assertEqual(load_batch_state(state_path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,25 @@ Unit tests for the core functionality of the openai_batch_sdk.
 
 This module includes tests for the following functions:
 - gen_submit_batch_job: Generates a function to submit batch jobs.
+- retrieve_batches_results: Streams and parses the records of a result file.
 - retrieve_batches_results_handler: Handles the retrieval of batch results.
 - init_monitoring: Initializes batch job monitoring.
-- graceful_shutdown: Signals the monitoring to stop gracefully.
+- shutdown: Signals the monitoring to stop and abandons in-flight polls.
+- graceful_shutdown: Cancels the outstanding tasks within a bounded time.
+- schedule_next_poll: Schedules the next status poll with jittered backoff.
+- poll_batch: Checks a single batch job, backing off on failure
+  and dropping batch jobs unknown to OpenAI.
+- list_monitored_batches: Fetches batch jobs through the batches list endpoint.
+- reconcile_listed_batches: Lists batch jobs only while listing is cheaper.
+- cancel_batch: Cancels a monitored batch job and its in-flight poll.
+- wait_for_batch_command: Wakes the monitor as soon as a command is queued.
+- spawn_task: Keeps a reference to background tasks until they are done.
+- pop_due_batch_ids: Pops the due polls from the poll schedule.
+- configure_event_loop: Uses uvloop only when it is installed.
+- configure_default_executor: Installs the thread pool once per event loop.
+- setup_signal_handlers: Stops the monitoring and the main task on exit signals.
+- batch_statuses_changed: Detects polls that changed the monitored batch jobs.
+- handle_batch_status: Resets the polling interval when the status changes.
 
 Each test verifies the correctness of these core functions,
 ensuring they work as expected with the help of mocks
@@ -14,47 +30,439 @@ for external dependencies.
 """
 
 import unittest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, AsyncMock, Mock
+import os
 import asyncio
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from openai import NotFoundError
+from openai.pagination import AsyncCursorPage
+from openai.types import Batch
 from openai_batch_sdk.core import (
+    graceful_shutdown,
+    apply_batch_commands,
+    background_tasks,
+    batch_statuses_changed,
+    cancel_batch,
+    check_batches_results,
+    configure_default_executor,
+    configure_event_loop,
+    default_executors,
     gen_submit_batch_job,
+    get_aborted_flag,
+    get_batch_commands,
+    handle_batch_status,
+    retrieve_batches_results,
     retrieve_batches_results_handler,
     init_monitoring,
+    list_monitored_batches,
+    monitored_batches,
+    new_poll_state,
+    poll_batch,
+    reconcile_listed_batches,
+    pop_due_batch_ids,
+    push_poll,
+    schedule_next_poll,
+    setup_signal_handlers,
+    seconds_until_next_poll,
+    spawn_task,
+    wait_for_batch_command,
+    BatchCommand,
     shutdown,
-    aborted,
+    ERROR_BACKOFF_FACTOR,
+    INITIAL_POLL_INTERVAL,
+    LIST_PAGE_SIZE,
+    MAX_POLL_INTERVAL,
 )
+from openai_batch_sdk.event_handler import EventHandler
 
 
-class TestCore(unittest.TestCase):
+class CoreTestCase(unittest.TestCase):
     """
-    Test suite for the core functionality of the openai_batch_sdk.
+    Base class of the core test suites, sharing one event loop per suite.
     """
 
-    @patch("openai_batch_sdk.core.submit_batch_job")
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create one event loop to run the coroutines of the test suite.
+        """
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Shut down the shared event loop and drop the asyncio primitives
+        created within it.
+        """
+        cls.loop.run_until_complete(cls.loop.shutdown_asyncgens())
+        cls.loop.run_until_complete(cls.loop.shutdown_default_executor())
+        cls.loop.close()
+        get_aborted_flag.cache_clear()
+        get_batch_commands.cache_clear()
+
+
+class TestPolling(CoreTestCase):
+    """
+    Test suite for the scheduling, polling and backoff of the monitored batch jobs.
+    """
+
+    @patch("openai_batch_sdk.core.time.monotonic", return_value=1000.0)
+    def test_schedule_next_poll(self, _):
+        """
+        Test the schedule_next_poll function to ensure the polling interval
+        grows exponentially, is capped, and the next poll is jittered.
+
+        Asserts:
+            The interval doubles on each poll until MAX_POLL_INTERVAL.
+            The next poll is due within the jitter bounds of the interval.
+        """
+        poll_state = new_poll_state("batch-id")
+        self.assertEqual(poll_state["interval"], INITIAL_POLL_INTERVAL)
+
+        schedule_next_poll(poll_state)
+        self.assertEqual(poll_state["interval"], INITIAL_POLL_INTERVAL * 2)
+        self.assertEqual(poll_state["attempts"], 1)
+        self.assertGreaterEqual(
+            poll_state["next_poll_at"], 1000.0 + INITIAL_POLL_INTERVAL
+        )
+        self.assertLessEqual(
+            poll_state["next_poll_at"], 1000.0 + INITIAL_POLL_INTERVAL * 3
+        )
+
+        for _ in range(10):
+            schedule_next_poll(poll_state)
+        self.assertEqual(poll_state["interval"], MAX_POLL_INTERVAL)
+
+    def test_pop_due_batch_ids(self):
+        """
+        Test the poll schedule helpers to ensure only due and current
+        polls are returned and stale entries are skipped.
+
+        Asserts:
+            Only the due batch job is popped.
+            Rescheduled and removed batch jobs are dropped as stale entries.
+            The sleep time targets the earliest current poll.
+        """
+        monitored_batch_ids = {
+            "due": new_poll_state("due"),
+            "later": new_poll_state("later"),
+            "removed": new_poll_state("removed"),
+        }
+        monitored_batch_ids["due"]["next_poll_at"] = 10.0
+        monitored_batch_ids["later"]["next_poll_at"] = 20.0
+        monitored_batch_ids["removed"]["next_poll_at"] = 5.0
+        poll_schedule = []
+        for poll_state in monitored_batch_ids.values():
+            push_poll(poll_schedule, poll_state)
+        del monitored_batch_ids["removed"]
+
+        self.assertEqual(
+            pop_due_batch_ids(poll_schedule, monitored_batch_ids, 15.0), ["due"]
+        )
+        monitored_batch_ids["later"]["next_poll_at"] = 30.0
+        push_poll(poll_schedule, monitored_batch_ids["later"])
+        self.assertEqual(
+            seconds_until_next_poll(poll_schedule, monitored_batch_ids, 15.0), 15.0
+        )
+        del monitored_batch_ids["later"]
+        self.assertIsNone(
+            seconds_until_next_poll(poll_schedule, monitored_batch_ids, 15.0)
+        )
+
+    def test_batch_statuses_changed(self):
+        """
+        Test the batch_statuses_changed function to ensure only status changes
+        and removals of the polled batch jobs are reported.
+
+        Asserts:
+            Unchanged statuses are not reported.
+            A changed status is reported.
+            A polled batch job that is no longer monitored is reported.
+        """
+        monitored_batch_ids = {"batch-id": new_poll_state("batch-id")}
+        monitored_batch_ids["batch-id"]["status"] = "in_progress"
+
+        self.assertFalse(
+            batch_statuses_changed(monitored_batch_ids, {"batch-id": "in_progress"})
+        )
+        self.assertTrue(
+            batch_statuses_changed(monitored_batch_ids, {"batch-id": "validating"})
+        )
+        self.assertTrue(
+            batch_statuses_changed(monitored_batch_ids, {"other-id": "in_progress"})
+        )
+
+    def test_handle_batch_status_resets_interval(self):
+        """
+        Test the handle_batch_status function to ensure the polling interval
+        keeps growing while the status is unchanged and resets on a change.
+
+        Asserts:
+            The interval doubles while the batch job stays in the same status.
+            The interval resets to INITIAL_POLL_INTERVAL when the status changes.
+        """
+        monitored_batch_ids = {"batch-id": new_poll_state("batch-id")}
+        monitored_batch_ids["batch-id"]["status"] = "validating"
+        event_handler = Mock(spec=EventHandler)
+
+        handle_batch_status(
+            event_handler,
+            monitored_batch_ids,
+            "batch-id",
+            Mock(spec=Batch, status="validating"),
+        )
+        self.assertEqual(
+            monitored_batch_ids["batch-id"]["interval"], INITIAL_POLL_INTERVAL * 2
+        )
+
+        handle_batch_status(
+            event_handler,
+            monitored_batch_ids,
+            "batch-id",
+            Mock(spec=Batch, status="in_progress"),
+        )
+        self.assertEqual(
+            monitored_batch_ids["batch-id"]["interval"], INITIAL_POLL_INTERVAL
+        )
+        event_handler.trigger_event.assert_not_called()
+
+    @patch("openai_batch_sdk.core.check_batches_results", new_callable=AsyncMock)
+    def test_poll_batch_backs_off_on_error(self, mock_check_batches_results):
+        """
+        Test the poll_batch function to ensure a failed status check
+        backs off the polling interval instead of propagating.
+
+        Args:
+            mock_check_batches_results: Mock for the check_batches_results function.
+
+        Asserts:
+            The interval grows by ERROR_BACKOFF_FACTOR.
+        """
+        mock_check_batches_results.side_effect = Exception("boom")
+        monitored_batch_ids = {"batch-id": new_poll_state("batch-id")}
+
+        async def run_test():
+            await poll_batch(
+                Mock(spec=EventHandler),
+                monitored_batch_ids,
+                "batch-id",
+                asyncio.Semaphore(1),
+            )
+
+        self.loop.run_until_complete(run_test())
+
+        self.assertEqual(
+            monitored_batch_ids["batch-id"]["interval"],
+            INITIAL_POLL_INTERVAL * ERROR_BACKOFF_FACTOR,
+        )
+
+    @patch("openai_batch_sdk.core.check_batches_results", new_callable=AsyncMock)
+    def test_poll_batch_drops_unknown_batch(self, mock_check_batches_results):
+        """
+        Test the poll_batch function to ensure a batch job unknown to OpenAI
+        is no longer monitored instead of being polled forever.
+
+        Args:
+            mock_check_batches_results: Mock for the check_batches_results function.
+
+        Asserts:
+            The batch job is removed from the monitored batch IDs.
+        """
+        request = httpx.Request("GET", "https://api.openai.com/v1/batches/batch-id")
+        mock_check_batches_results.side_effect = NotFoundError(
+            "not found", response=httpx.Response(404, request=request), body=None
+        )
+        monitored_batch_ids = {"batch-id": new_poll_state("batch-id")}
+
+        self.loop.run_until_complete(
+            poll_batch(
+                Mock(spec=EventHandler),
+                monitored_batch_ids,
+                "batch-id",
+                asyncio.Semaphore(1),
+            )
+        )
+
+        self.assertNotIn("batch-id", monitored_batch_ids)
+
+    @patch("openai_batch_sdk.core.list_batches_async", new_callable=AsyncMock)
+    def test_list_monitored_batches(self, mock_list_batches):
+        """
+        Test the list_monitored_batches function to ensure it pages through
+        the batches list until every requested batch job is found.
+
+        Args:
+            mock_list_batches: Mock for the list_batches_async function.
+
+        Asserts:
+            The second page is requested after the last ID of the first page.
+            Only the requested batch jobs are returned.
+        """
+        first_page = Mock(spec=AsyncCursorPage)
+        first_page.data = [
+            Mock(spec=Batch, id=f"batch-{i}") for i in range(LIST_PAGE_SIZE)
+        ]
+        second_page = Mock(spec=AsyncCursorPage)
+        second_page.data = [Mock(spec=Batch, id="batch-old")]
+        mock_list_batches.side_effect = [first_page, second_page]
+
+        result = self.loop.run_until_complete(
+            list_monitored_batches(["batch-1", "batch-old", "batch-gone"])
+        )
+
+        mock_list_batches.assert_called_with(
+            limit=LIST_PAGE_SIZE, after=f"batch-{LIST_PAGE_SIZE - 1}"
+        )
+        self.assertEqual(set(result), {"batch-1", "batch-old"})
+
+    @patch("openai_batch_sdk.core.list_batches_async", new_callable=AsyncMock)
+    def test_reconcile_listed_batches(self, mock_list_batches):
+        """
+        Test the reconcile_listed_batches function to ensure listing never
+        costs more requests than checking the batch jobs one by one,
+        and batch jobs missing from a listing are not listed again.
+
+        Args:
+            mock_list_batches: Mock for the list_batches_async function.
+
+        Asserts:
+            Two due batch jobs are looked up in a single page.
+            The batch jobs missing from it are left to individual checks,
+            the next time without any batches list request.
+        """
+        full_page = Mock(spec=AsyncCursorPage)
+        full_page.data = [
+            Mock(spec=Batch, id=f"batch-{i}") for i in range(LIST_PAGE_SIZE)
+        ]
+        mock_list_batches.return_value = full_page
+        monitored_batch_ids = {
+            batch_id: new_poll_state(batch_id) for batch_id in ("old-1", "old-2")
+        }
+
+        def reconcile():
+            return self.loop.run_until_complete(
+                reconcile_listed_batches(
+                    Mock(spec=EventHandler),
+                    monitored_batch_ids,
+                    ["old-1", "old-2"],
+                    asyncio.Event(),
+                )
+            )
+
+        self.assertEqual(reconcile(), ["old-1", "old-2"])
+        mock_list_batches.assert_awaited_once()
+        self.assertEqual(reconcile(), ["old-1", "old-2"])
+        mock_list_batches.assert_awaited_once()
+
+    def test_wait_for_batch_command(self):
+        """
+        Test the wait_for_batch_command function to ensure a queued command
+        wakes the monitor before the next poll is due.
+
+        Asserts:
+            The queued command is returned well before the timeout.
+            None is returned when monitoring is aborted.
+        """
+
+        async def run_test():
+            commands = asyncio.Queue()
+            aborted_flag = asyncio.Event()
+            asyncio.get_running_loop().call_soon(
+                commands.put_nowait, BatchCommand("add", "batch-id")
+            )
+            command = await asyncio.wait_for(
+                wait_for_batch_command(commands, aborted_flag, 3600), timeout=1
+            )
+            aborted_flag.set()
+            return command, await wait_for_batch_command(commands, aborted_flag, None)
+
+        command, aborted_command = self.loop.run_until_complete(run_test())
+
+        self.assertEqual(command, BatchCommand("add", "batch-id"))
+        self.assertIsNone(aborted_command)
+
+
+class TestCore(CoreTestCase):
+    """
+    Test suite for the submission, retrieval, cancellation and lifecycle
+    of the monitored batch jobs.
+    """
+
+    @patch("openai_batch_sdk.core.submit_batch_job_async", new_callable=AsyncMock)
     def test_gen_submit_batch_job(self, mock_submit_batch_job):
         """
         Test the gen_submit_batch_job function to ensure it correctly generates
         a function to submit batch jobs.
 
         Args:
-            mock_submit_batch_job: Mock for the submit_batch_job function.
+            mock_submit_batch_job: Mock for the submit_batch_job_async function.
 
         Asserts:
-            The submit_batch_job function is called once with the correct parameters.
+            The submit_batch_job_async function is awaited once
+            with the correct parameters.
             The function returns the expected batch ID.
-            The batch ID is added to the monitored batch IDs.
+            The batch ID is added to the monitored batch IDs,
+            with the file path and description,
+            once the monitor applies the queued commands.
         """
         mock_submit_batch_job.return_value = "batch-id"
         monitored_batch_ids = {}
 
-        add_batch_job = gen_submit_batch_job(monitored_batch_ids, "test description")
-        result = add_batch_job("mock_data.jsonl")
+        async def run_test():
+            commands = asyncio.Queue()
+            add_batch_job = gen_submit_batch_job(commands, "test description")
+            result = await add_batch_job("mock_data.jsonl")
+            apply_batch_commands(monitored_batch_ids, [], commands)
+            return result
+
+        result = self.loop.run_until_complete(run_test())
 
-        mock_submit_batch_job.assert_called_once_with(
+        mock_submit_batch_job.assert_awaited_once_with(
             "mock_data.jsonl", "test description"
         )
         self.assertEqual(result, "batch-id")
         self.assertIn("batch-id", monitored_batch_ids)
+        self.assertEqual(monitored_batch_ids["batch-id"]["attempts"], 0)
+        self.assertEqual(
+            monitored_batch_ids["batch-id"]["meta"],
+            {"file_path": "mock_data.jsonl", "description": "test description"},
+        )
+
+    @patch("openai_batch_sdk.core.iter_batch_result_lines_async")
+    def test_retrieve_batches_results(self, mock_iter_batch_result_lines):
+        """
+        Test the retrieve_batches_results function to ensure it parses
+        each streamed line of the result file.
+
+        Args:
+            mock_iter_batch_result_lines:
+            Mock for the iter_batch_result_lines_async function.
+
+        Asserts:
+            The function yields one parsed record per line.
+        """
+
+        async def lines():
+            yield b'{"custom_id": "request-1"}'
+            yield b'{"custom_id": "request-2"}'
+
+        mock_iter_batch_result_lines.return_value = lines()
+
+        async def run_test():
+            records = await retrieve_batches_results("file-id")
+            return [record async for record in records]
+
+        result = self.loop.run_until_complete(run_test())
+
+        self.assertEqual(
+            result,
+            [{"custom_id": "request-1"}, {"custom_id": "request-2"}],
+        )
+        mock_iter_batch_result_lines.assert_called_once_with("file-id")
 
     @patch("openai_batch_sdk.core.retrieve_batches_results", new_callable=AsyncMock)
     def test_retrieve_batches_results_handler(self, mock_retrieve_batches_results):
@@ -69,16 +477,108 @@ class TestCore(unittest.TestCase):
         Asserts:
             The function returns the expected response.
         """
-        mock_response = MagicMock()
+        mock_response = Mock()
         mock_retrieve_batches_results.return_value = mock_response
 
         batch_completed_event = {"batch_id": "batch-id", "response": mock_response}
-        result = asyncio.run(retrieve_batches_results_handler(batch_completed_event))
+        result = self.loop.run_until_complete(
+            retrieve_batches_results_handler(batch_completed_event)
+        )
 
         self.assertEqual(result, mock_response)
 
+    @patch("openai_batch_sdk.core.cancel_batch_job_async", new_callable=AsyncMock)
+    @patch("openai_batch_sdk.core.check_batch_status_async")
+    def test_cancel_batch(self, mock_check_batch_status, mock_cancel_batch_job):
+        """
+        Test the cancel_batch function to ensure it abandons the in-flight
+        poll of the batch job and cancels it on OpenAI.
+
+        Args:
+            mock_check_batch_status: Mock for the check_batch_status_async function.
+            mock_cancel_batch_job: Mock for the cancel_batch_job_async function.
+
+        Asserts:
+            The in-flight poll returns without triggering any event.
+            The batch job is no longer monitored and is cancelled on OpenAI.
+        """
+        event_handler = Mock(spec=EventHandler)
+
+        async def never_answers(**_):
+            await asyncio.sleep(3600)
+
+        mock_check_batch_status.side_effect = never_answers
+
+        async def run_test():
+            monitored_batches["batch-id"] = new_poll_state("batch-id")
+            poll = asyncio.create_task(
+                check_batches_results(event_handler, monitored_batches, "batch-id")
+            )
+            await asyncio.sleep(0)
+            await cancel_batch("batch-id")
+            await asyncio.wait_for(poll, timeout=1)
+            apply_batch_commands(monitored_batches, [], get_batch_commands())
+
+        self.loop.run_until_complete(run_test())
+
+        event_handler.trigger_event.assert_not_called()
+        self.assertNotIn("batch-id", monitored_batches)
+        mock_cancel_batch_job.assert_awaited_once_with("batch-id")
+
+    @patch("openai_batch_sdk.core.cancel_batch_job_async", new_callable=AsyncMock)
+    def test_cancel_batch_failure_keeps_monitoring(self, mock_cancel_batch_job):
+        """
+        Test the cancel_batch function to ensure a batch job whose cancellation
+        failed on OpenAI is still monitored.
+
+        Args:
+            mock_cancel_batch_job: Mock for the cancel_batch_job_async function.
+
+        Asserts:
+            The cancellation error is raised.
+            The batch job is still monitored and its polls are not abandoned.
+        """
+        mock_cancel_batch_job.side_effect = Exception("boom")
+
+        async def run_test():
+            monitored_batches["batch-id"] = new_poll_state("batch-id")
+            with self.assertRaises(Exception):
+                await cancel_batch("batch-id")
+            apply_batch_commands(monitored_batches, [], get_batch_commands())
+
+        try:
+            self.loop.run_until_complete(run_test())
+
+            self.assertIn("batch-id", monitored_batches)
+            self.assertFalse(monitored_batches["batch-id"]["cancel"].is_set())
+        finally:
+            monitored_batches.pop("batch-id", None)
+
+    def test_spawn_task(self):
+        """
+        Test the spawn_task function to ensure the task is referenced
+        while running and released once done.
+
+        Asserts:
+            The task is in background_tasks while running.
+            The task is removed from background_tasks once done.
+        """
+
+        async def run_test():
+            task = spawn_task(asyncio.sleep(0))
+            self.assertIn(task, background_tasks)
+            await task
+            await asyncio.sleep(0)
+            return task
+
+        task = self.loop.run_until_complete(run_test())
+
+        self.assertNotIn(task, background_tasks)
+
+    @patch("openai_batch_sdk.core.setup_logging")
+    @patch("openai_batch_sdk.core.load_batch_state", return_value={})
     @patch("openai_batch_sdk.core.monitor_batches", new_callable=AsyncMock)
-    def test_init_monitoring(self, mock_monitor_batches):
+    def test_init_monitoring(self, mock_monitor_batches, *_):
         """
         Test the init_monitoring function to ensure it correctly initializes
         batch job monitoring.
@@ -89,8 +589,9 @@ class TestCore(unittest.TestCase):
         Asserts:
             The returned add_batch_job function is of the correct type.
             The monitor_batches function is called once.
+            The default executor is replaced by the batch thread pool.
         """
-        event_handler = MagicMock()
+        event_handler = Mock(spec=EventHandler)
         monitored_batch_ids = {}
 
         async def run_test():
@@ -100,30 +601,153 @@ class TestCore(unittest.TestCase):
                 type(gen_submit_batch_job(monitored_batch_ids, "test description")),
             )
             mock_monitor_batches.assert_called_once()
+            thread_name = await asyncio.to_thread(
+                lambda: threading.current_thread().name
+            )
+            self.assertTrue(thread_name.startswith("oai-batch"))
+
+        self.loop.run_until_complete(run_test())
+
+    def test_configure_default_executor(self):
+        """
+        Test the configure_default_executor function to ensure the thread pool
+        is installed once per event loop and an existing executor is kept.
+
+        Asserts:
+            Configuring the same event loop again returns the installed pool.
+            A default executor set by the application is not replaced.
+        """
+        app_loop = asyncio.new_event_loop()
+        other_loop = asyncio.new_event_loop()
+        app_executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            executor = configure_default_executor(app_loop)
+            self.assertIs(configure_default_executor(app_loop), executor)
+
+            other_loop.set_default_executor(app_executor)
+            self.assertIsNone(configure_default_executor(other_loop))
+            self.assertNotIn(other_loop, default_executors)
+        finally:
+            app_loop.run_until_complete(app_loop.shutdown_default_executor())
+            app_loop.close()
+            other_loop.run_until_complete(other_loop.shutdown_default_executor())
+            other_loop.close()
+
+    @patch("openai_batch_sdk.core.asyncio.set_event_loop_policy")
+    @patch("openai_batch_sdk.core.find_spec", return_value=None)
+    def test_configure_event_loop_without_uvloop(self, _, mock_set_policy):
+        """
+        Test the configure_event_loop function to ensure the default
+        event loop policy is kept when uvloop is not installed.
+
+        Args:
+            mock_set_policy: Mock for the asyncio.set_event_loop_policy function.
+
+        Asserts:
+            The function returns False.
+            The event loop policy is not changed.
+        """
+        self.assertFalse(configure_event_loop())
+        mock_set_policy.assert_not_called()
 
-        asyncio.run(run_test())
+    def test_shutdown(self):
+        """
+        Test the shutdown function to ensure it signals the monitoring
+        to stop and abandons the in-flight polls.
 
-    def test_graceful_shutdown(self):
+        Asserts:
+            The aborted event is not set before calling shutdown.
+            The aborted event is set after calling shutdown.
+            The cancel event of each monitored batch job is set.
         """
-        Test the graceful_shutdown function to ensure it correctly signals
-        the monitoring to stop.
+        get_aborted_flag().clear()
+        self.assertFalse(get_aborted_flag().is_set())
+        monitored_batches["batch-id"] = new_poll_state("batch-id")
+
+        try:
+            shutdown()
+
+            self.assertTrue(get_aborted_flag().is_set())
+            self.assertTrue(monitored_batches["batch-id"]["cancel"].is_set())
+        finally:
+            get_aborted_flag().clear()
+            monitored_batches.pop("batch-id", None)
+
+    def test_graceful_shutdown_cancels_tasks(self):
+        """
+        Test the graceful_shutdown function to ensure outstanding tasks
+        are cancelled right away instead of after a fixed delay.
 
         Asserts:
-            The aborted event is not set before calling graceful_shutdown.
-            The aborted event is set after calling graceful_shutdown.
+            The shutdown completes within a second.
+            The outstanding task is cancelled.
+            The monitoring is signaled to stop.
         """
-        # Ensure the aborted event is not set before calling graceful_shutdown
-        aborted.clear()
-        self.assertFalse(aborted.is_set())
 
-        # Call graceful_shutdown to set the aborted event
-        shutdown()
+        async def run_test():
+            task = asyncio.ensure_future(asyncio.sleep(3600))
+            started_at = time.monotonic()
+            await graceful_shutdown()
+            return task, time.monotonic() - started_at
+
+        try:
+            task, elapsed = self.loop.run_until_complete(run_test())
+
+            self.assertLess(elapsed, 1)
+            self.assertTrue(task.cancelled())
+            self.assertTrue(get_aborted_flag().is_set())
+        finally:
+            get_aborted_flag().clear()
+
+    @patch("openai_batch_sdk.core.shutdown")
+    def test_setup_signal_handlers(self, mock_shutdown):
+        """
+        Test the setup_signal_handlers function to ensure SIGINT and SIGTERM
+        signal the monitoring to stop and cancel the main task.
+
+        Args:
+            mock_shutdown: Mock for the shutdown function.
 
-        # Check that the aborted event is set
-        self.assertTrue(aborted.is_set())
+        Asserts:
+            A handler is registered for SIGINT and SIGTERM.
+            Each handler signals the monitoring to stop.
+            Each handler cancels the given main task.
+        """
+        app_loop = Mock(spec=asyncio.AbstractEventLoop)
+        main_task = Mock(spec=asyncio.Task)
+
+        setup_signal_handlers(app_loop, main_task)
+
+        registered = app_loop.add_signal_handler.call_args_list
+        self.assertEqual(
+            [call.args[0] for call in registered], [signal.SIGINT, signal.SIGTERM]
+        )
+        registered[1].args[1]()
+        mock_shutdown.assert_called_once_with()
+        main_task.cancel.assert_called_once_with()
+
+    def test_setup_signal_handlers_cancels_calling_task(self):
+        """
+        Test the setup_signal_handlers function to ensure an exit signal
+        stops a main coroutine that does not wait for the monitoring to stop.
+
+        Asserts:
+            The task that set up the signal handlers is cancelled on SIGTERM.
+        """
+
+        async def run_test():
+            app_loop = asyncio.get_running_loop()
+            setup_signal_handlers(app_loop)
+            app_loop.call_soon(os.kill, os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(3600)
 
-        # Reset the aborted event after the test
-        aborted.clear()
+        try:
+            with self.assertRaises(asyncio.CancelledError):
+                self.loop.run_until_complete(run_test())
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                self.loop.remove_signal_handler(sig)
+            get_aborted_flag().clear()
 
 
 if __name__ == "__main__":
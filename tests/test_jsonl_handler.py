@@ -0,0 +1,78 @@
+"""
+file: tests/test_jsonl_handler.py
+Unit tests for the JSON lines utilities.
+
+This module includes tests for the following functions:
+- create_json_line: Creates a JSON line from a conversation.
+- write_jsonl_file: Writes multiple JSON lines to a file.
+- iter_jsonl: Reads the JSON lines of a file through a memory map.
+"""
+
+import os
+import tempfile
+import unittest
+import orjson
+from utils.gpt_conversation_handler import Role, create_message
+from utils.jsonl_handler import create_json_line, iter_jsonl, write_jsonl_file
+
+
+class TestJsonlHandler(unittest.TestCase):
+    """
+    Test suite for the JSON lines utilities.
+    """
+
+    def test_write_and_iter_jsonl(self):
+        """
+        Test the write_jsonl_file and iter_jsonl functions to ensure
+        the JSON lines survive a round trip through a file.
+
+        Asserts:
+            One line is read back per written JSON line.
+            Each line parses back to the written request.
+        """
+        conversation = [
+            create_message(Role.SYSTEM, "You are a helpful assistant."),
+            create_message(Role.USER, "Hello!"),
+        ]
+        json_lines = [
+            create_json_line(custom_id=f"request-{i}", conversation=conversation)
+            for i in range(3)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "batch.jsonl")
+            write_jsonl_file(filename, json_lines)
+            records = [orjson.loads(line) for line in iter_jsonl(filename)]
+
+        self.assertEqual(
+            [record["custom_id"] for record in records],
+            [
+                "request-0",
+                "request-1",
+                "request-2",
+            ],
+        )
+        self.assertEqual(
+            records[0]["body"]["messages"],
+            [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Hello!"},
+            ],
+        )
+
+    def test_iter_jsonl_empty_file(self):
+        """
+        Test the iter_jsonl function to ensure an empty file yields no lines.
+
+        Asserts:
+            No line is read from an empty file.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "empty.jsonl")
+            with open(filename, "wb"):
+                pass
+            self.assertEqual(list(iter_jsonl(filename)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+"""
+file: tests/test_logging.py
+Unit tests for the logging setup of the application.
+
+This module includes tests for the following functions:
+- get_lib_logger: Returns a cached logger for a specific library.
+- get_module_logger: Returns a cached logger for a specific module.
+- get_ad_processing_logger: Returns a cached logger for an ad processing stage.
+- clear_logger_caches: Forgets the cached loggers.
+- configure_log_levels: Configures the log levels once, on first use.
+- EmojiFormatter: Adds emojis to log levels.
+- ChildAttrFilter: Adds the child logger name to emitted records.
+- setup_logging: Adds the console and file handlers only once.
+- BufferedFileHandler: Flushes the log file on errors rather than every record.
+- stop_log_listener: Stops the listener and the periodic flush at exit.
+- teardown_logging: Stops the listener and removes the handlers.
+- FeatureFilter: Keeps only records mentioning one of the features.
+"""
+
+import logging
+import logging.handlers
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from utils.logging import (
+    BufferedFileHandler,
+    ChildAttrFilter,
+    EmojiFormatter,
+    FeatureFilter,
+    clear_logger_caches,
+    configure_log_levels,
+    get_ad_processing_logger,
+    get_lib_logger,
+    get_module_logger,
+    logger,
+    setup_logging,
+    start_periodic_flush,
+    stop_log_listener,
+    teardown_logging,
+    PRJ_SRC_LEN,
+)
+from utils.project import get_project_root
+
+
+class TestLogging(unittest.TestCase):
+    """
+    Test suite for the logging setup of the application.
+    """
+
+    def tearDown(self):
+        """
+        Drop the cached loggers so each test starts from fresh getters.
+        """
+        clear_logger_caches()
+
+    def test_loggers_are_cached(self):
+        """
+        Test the logger getters to ensure each logger is created
+        and configured only once.
+
+        Asserts:
+            The getters return the same logger for the same name.
+            The library logger is named after the path relative to src.
+            The level is set only on the first call.
+        """
+        lib_name = f"{get_project_root()}/src/utils/env.py"
+        self.assertEqual(len(f"{get_project_root()}/src/"), PRJ_SRC_LEN)
+
+        lib_logger = get_lib_logger(lib_name)
+        self.assertEqual(lib_logger.name, "APP.[utils/env.py]")
+        with patch.object(lib_logger, "setLevel") as mock_set_level:
+            self.assertIs(get_lib_logger(lib_name), lib_logger)
+            mock_set_level.assert_not_called()
+
+        self.assertIs(get_module_logger("module"), get_module_logger("module"))
+        self.assertIs(get_ad_processing_logger("🎯"), get_ad_processing_logger("🎯"))
+
+    def test_configure_log_levels(self):
+        """
+        Test the configure_log_levels function to ensure the log levels
+        are resolved once and applied to the APP logger.
+
+        Asserts:
+            Repeated calls return the same numeric levels.
+            The APP logger is set to the app log level.
+        """
+        level_nos = configure_log_levels()
+        self.assertIs(configure_log_levels(), level_nos)
+        self.assertIsInstance(level_nos["low_log_level"], int)
+        self.assertEqual(logger.level, level_nos["app_log_level"])
+
+    def test_clear_logger_caches(self):
+        """
+        Test the clear_logger_caches function to ensure the getters
+        start over after clearing.
+
+        Asserts:
+            The caches are empty after clearing.
+            Getting a logger again does not reset a level already in place.
+        """
+        get_module_logger("module")
+        stage_logger = get_ad_processing_logger("🎯")
+        clear_logger_caches()
+        self.assertEqual(get_module_logger.cache_info().currsize, 0)
+        with patch.object(stage_logger, "setLevel") as mock_set_level:
+            self.assertIs(get_ad_processing_logger("🎯"), stage_logger)
+            mock_set_level.assert_not_called()
+
+    def test_emoji_formatter(self):
+        """
+        Test the EmojiFormatter and the ChildAttrFilter classes
+        to ensure emitted records get the level emoji, the app emoji
+        and the child logger name.
+
+        Asserts:
+            The levelname is replaced by its emoji in the formatted message,
+            and kept on the record.
+            The name is replaced by the app emoji, once filtered.
+            The child is the logger name without the APP prefix,
+            and empty for the APP logger itself.
+            Filtering or formatting a record twice leaves it unchanged.
+        """
+        child_filter = ChildAttrFilter()
+        formatter = EmojiFormatter("%(name)s%(levelname)s%(child)s%(message)s")
+        record = logging.LogRecord(
+            "APP.[child]", logging.WARNING, __file__, 1, "message", (), None
+        )
+        self.assertTrue(child_filter.filter(record))
+        self.assertEqual(formatter.format(record), "🌐👀[child]message")
+        self.assertEqual(record.levelname, "WARNING")
+        child_filter.filter(record)
+        self.assertEqual(formatter.format(record), "🌐👀[child]message")
+
+        record = logging.LogRecord(
+            "APP", logging.INFO, __file__, 1, "message", (), None
+        )
+        child_filter.filter(record)
+        self.assertEqual(getattr(record, "child"), "")
+
+    def test_setup_logging_is_idempotent(self):
+        """
+        Test the setup_logging function to ensure repeated calls
+        do not register duplicate handlers.
+
+        Asserts:
+            The handlers of the APP logger are unchanged by a second call.
+            The APP logger only enqueues records for the listener thread.
+            The records are written to the given log file.
+            Tearing logging down removes the queue handler.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, "app.log")
+            try:
+                setup_logging(log_file)
+                handlers = list(logger.handlers)
+
+                setup_logging(log_file)
+
+                self.assertEqual(logger.handlers, handlers)
+                queue_handlers = [
+                    handler
+                    for handler in handlers
+                    if isinstance(handler, logging.handlers.QueueHandler)
+                ]
+                self.assertEqual(len(queue_handlers), 1)
+                logger.error("message")
+            finally:
+                teardown_logging()
+
+            self.assertNotIn(queue_handlers[0], logger.handlers)
+            with open(log_file, encoding="utf-8") as file:
+                self.assertIn("message", file.read())
+
+    def test_buffered_file_handler(self):
+        """
+        Test the BufferedFileHandler class to ensure records are buffered
+        until an error is logged or the handler is flushed.
+
+        Asserts:
+            An info record is not written to the file right away.
+            An error record flushes the buffered records to the file.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "app.log")
+            handler = BufferedFileHandler(filename)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            try:
+                handler.handle(
+                    logging.LogRecord("APP", logging.INFO, "", 1, "info", (), None)
+                )
+                with open(filename, encoding="utf-8") as file:
+                    self.assertEqual(file.read(), "")
+
+                handler.handle(
+                    logging.LogRecord("APP", logging.ERROR, "", 1, "error", (), None)
+                )
+                with open(filename, encoding="utf-8") as file:
+                    self.assertEqual(file.read(), "info\nerror\n")
+            finally:
+                handler.close()
+
+    def test_feature_filter(self):
+        """
+        Test the FeatureFilter class to ensure records are kept only when
+        their message mentions one of the features.
+
+        Asserts:
+            Records mentioning any of the features pass the filter.
+            Records mentioning none of them, or only a regex lookalike, do not.
+        """
+        feature_filter = FeatureFilter("FEATURE", "A.B")
+
+        def record(msg, *args):
+            return logging.LogRecord("APP", logging.INFO, "", 1, msg, args, None)
+
+        self.assertTrue(feature_filter.filter(record("FEATURE on")))
+        self.assertTrue(feature_filter.filter(record("%s on", "A.B")))
+        self.assertFalse(feature_filter.filter(record("AxB on")))
+        self.assertFalse(feature_filter.filter(record("nothing")))
+
+    def test_stop_log_listener(self):
+        """
+        Test the stop_log_listener function to ensure the periodic flush
+        stops along with the listener.
+
+        Asserts:
+            The listener is stopped.
+            The flush thread returns once stopped.
+        """
+        handler = Mock(spec=logging.Handler)
+        listener = Mock(spec=logging.handlers.QueueListener)
+        running_threads = set(threading.enumerate())
+        flush_stopped = start_periodic_flush(handler, interval=0.01)
+        (flush_thread,) = set(threading.enumerate()) - running_threads
+
+        stop_log_listener(listener, flush_stopped)
+        flush_thread.join(timeout=1)
+
+        listener.stop.assert_called_once_with()
+        self.assertFalse(flush_thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()